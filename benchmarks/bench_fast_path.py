@@ -0,0 +1,51 @@
+"""
+Per-iteration overhead of `run_bisection_method` compared with the fused `run_bisection_fast` loop.
+
+Run from the repository root after `pip install -e .`:
+    python benchmarks/bench_fast_path.py
+"""
+from bisectionmethod import bisection_method as bim
+import time
+
+
+def fcn(x):
+    return x * x - 2.0
+
+
+def time_per_iteration(solver, num_repeat: int = 2000, **kwargs) -> float:
+    """
+    Given a solver with the `run_bisection_method` signature.
+    Will return the average wall-clock time per iteration in seconds, including the call to fcn.
+    """
+    num_iter = solver(fcn, 0.0, 10.0, 10 ** -12, 10 ** -30, **kwargs)["num_iter"]
+    start = time.perf_counter()
+    for _ in range(num_repeat):
+        solver(fcn, 0.0, 10.0, 10 ** -12, 10 ** -30, **kwargs)
+    return (time.perf_counter() - start) / (num_repeat * num_iter)
+
+
+def time_per_call(num_repeat: int = 200000) -> float:
+    """
+    Will return the average wall-clock time of a single call to fcn in seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(num_repeat):
+        fcn(1.5)
+    return (time.perf_counter() - start) / num_repeat
+
+
+def main():
+    fcn_time = time_per_call()
+    cases = [("run_bisection_method (history=list)", bim.run_bisection_method, {}),
+             ("run_bisection_method (history=none)", bim.run_bisection_method, {"history": "none"}),
+             ("run_bisection_fast", bim.run_bisection_fast, {}),
+             ("run_bisection_fast (validate=False)", bim.run_bisection_fast, {"validate": False})]
+    print(f"fcn call: {fcn_time * 1e9:8.1f} ns")
+    print(f"{'solver':40s} {'ns/iter':>10s} {'overhead ns/iter':>18s}")
+    for name, solver, kwargs in cases:
+        iter_time = time_per_iteration(solver, **kwargs)
+        print(f"{name:40s} {iter_time * 1e9:10.1f} {(iter_time - fcn_time) * 1e9:18.1f}")
+
+
+if __name__ == "__main__":
+    main()
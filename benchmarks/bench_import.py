@@ -0,0 +1,53 @@
+"""
+Cold import time of the solver module, which must not import matplotlib, asyncio or multiprocessing.
+
+Run from the repository root after `pip install -e .`:
+    python benchmarks/bench_import.py --max-ms 500
+
+Every measurement starts a fresh interpreter. The script exits with status 1 if one of LAZY_MODULES is imported
+or if the median import time is above --max-ms.
+"""
+import argparse
+import subprocess
+import sys
+
+LAZY_MODULES = ("matplotlib", "asyncio", "multiprocessing")
+
+IMPORT_SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+from bisectionmethod import bisection_method
+print(time.perf_counter() - start, ",".join(name for name in %r if name in sys.modules) or "-")
+""" % (LAZY_MODULES,)
+
+
+def time_import(module_script: str = IMPORT_SCRIPT) -> tuple:
+    """
+    Will return the import time in seconds in a fresh interpreter and the LAZY_MODULES that were imported.
+    """
+    output = subprocess.run([sys.executable, "-c", module_script], capture_output=True, text=True, check=True).stdout.split()
+    return float(output[0]), [] if output[1] == "-" else output[1].split(",")
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-repeat", type=int, default=7, help="number of fresh interpreters to time")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if the median import time is above this")
+    args = parser.parse_args(argv)
+    measurements = [time_import() for _ in range(args.num_repeat)]
+    times = sorted(measurement[0] for measurement in measurements)
+    median_ms = times[len(times) // 2] * 1000.0
+    loaded = sorted(set(name for measurement in measurements for name in measurement[1]))
+    print(f"import bisectionmethod.bisection_method: median {median_ms:.1f} ms, min {times[0] * 1000.0:.1f} ms")
+    print(f"lazy modules imported: {', '.join(loaded) or 'none'}")
+    if loaded:
+        return 1
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"REGRESSION median import time {median_ms:.1f} ms > {args.max_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
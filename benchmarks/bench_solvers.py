@@ -0,0 +1,189 @@
+"""
+Throughput, evaluations and memory benchmarks for the solvers, with JSON regression baselines.
+
+Run from the repository root after `pip install -e .`:
+    python benchmarks/bench_solvers.py --save benchmarks/baseline.json
+    python benchmarks/bench_solvers.py --compare benchmarks/baseline.json
+
+With --compare, the script exits with status 1 if any case is slower (solves/sec) or needs more evaluations
+per solve than the baseline by more than --threshold (relative, default 0.25).
+"""
+from bisectionmethod import bisection_method as bim
+import argparse
+import json
+import numpy as np
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+
+def fcn_1(x):
+    return x ** 2 - 2
+
+
+def fcn_2(x):
+    return (x - 10.75) ** 3.0
+
+
+def fcn_3(x):
+    return x
+
+
+def fcn_cos(x):
+    return np.cos(x) - x
+
+
+def fcn_steep(x):
+    return np.arctan(10 ** 4 * (x - 0.3))
+
+
+def fcn_flat(x):
+    return x ** 9
+
+
+# name: (fcn, a, b)
+FUNCTIONS = {"x**2 - 2": (fcn_1, 0.0, 10.0),
+             "(x - 10.75)**3": (fcn_2, 0.0, 20.0),
+             "x": (fcn_3, -1.0, 3.0),
+             "cos(x) - x": (fcn_cos, 0.0, 1.0),
+             "atan(1e4 (x - 0.3))": (fcn_steep, 0.0, 1.0),
+             "x**9": (fcn_flat, -1.0, 3.1)}
+
+TOL_INPUT = 10 ** -10
+TOL_OUTPUT = 10 ** -30
+BATCH_SIZE = 10000
+
+
+def time_solver(solve, min_time: float, num_repeat: int = 3) -> float:
+    """
+    Given a function that runs one solve and a minimum measurement time in seconds.
+    Will return the number of solves per second, as the best of num_repeat measurements to reduce noise.
+    """
+    best = 0.0
+    for _ in range(num_repeat):
+        num_solve = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            solve()
+            num_solve += 1
+            elapsed = time.perf_counter() - start
+        best = max(best, num_solve / elapsed)
+    return best
+
+
+def time_fcn(fcn, x: float, num_repeat: int = 10000) -> float:
+    """
+    Given a function and a point.
+    Will return the average time of one call in seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(num_repeat):
+        fcn(x)
+    return (time.perf_counter() - start) / num_repeat
+
+
+def peak_memory(solve) -> int:
+    """
+    Given a function that runs one solve.
+    Will return the peak memory allocated during the solve in bytes.
+    """
+    tracemalloc.start()
+    solve()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def scalar_cases() -> list:
+    """
+    Will return (solver name, keyword arguments) for every scalar solver path.
+    """
+    cases = [("bisection/list", bim.run_bisection_method, {}),
+             ("bisection/none", bim.run_bisection_method, {"history": "none"}),
+             ("bisection/array", bim.run_bisection_method, {"history": "array"})]
+    cases += [(f"{method}/none", bim.run_bisection_method, {"method": method, "history": "none"}) for method in ["illinois", "brent", "itp"]]
+    cases += [("fast", bim.run_bisection_fast, {}),
+              ("float_bits/none", bim.run_bisection_float_bits, {"history": "none"})]
+    return cases
+
+
+def run_benchmarks(min_time: float) -> dict:
+    """
+    Given a minimum measurement time per case in seconds.
+    Will return a dictionary of results keyed by "function | solver".
+    """
+    results = {}
+    for fcn_name, (fcn, a, b) in FUNCTIONS.items():
+        fcn_time = time_fcn(fcn, (a + b) / 2.0)
+        for solver_name, solver, kwargs in scalar_cases():
+            def solve():
+                return solver(fcn, a, b, TOL_INPUT, TOL_OUTPUT, **kwargs)
+            result = solve()
+            solves_per_sec = time_solver(solve, min_time)
+            num_iter = max(result["num_iter"], 1)
+            results[f"{fcn_name} | {solver_name}"] = {"solves_per_sec": solves_per_sec,
+                                                      "evals_per_solve": result["num_eval"],
+                                                      "overhead_ns_per_iter": (1.0 / solves_per_sec - result["num_eval"] * fcn_time) / num_iter * 10 ** 9,
+                                                      "peak_memory_bytes": peak_memory(solve)}
+        # the batch solver is timed per lane
+        a_batch = np.full(BATCH_SIZE, a)
+        b_batch = np.full(BATCH_SIZE, b)
+
+        def solve_batch():
+            return bim.run_bisection_batch(fcn, a_batch, b_batch, TOL_INPUT, TOL_OUTPUT)
+        result = solve_batch()
+        results[f"{fcn_name} | batch"] = {"solves_per_sec": time_solver(solve_batch, min_time) * BATCH_SIZE,
+                                          "evals_per_solve": int(np.max(result["num_iter"])) + 2,
+                                          "overhead_ns_per_iter": None,
+                                          "peak_memory_bytes": peak_memory(solve_batch) / BATCH_SIZE}
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Given new results, baseline results, and a relative threshold.
+    Will return a list of messages, one for every regression.
+    """
+    regressions = []
+    for key, found in results.items():
+        if key not in baseline:
+            continue
+        known = baseline[key]
+        if found["solves_per_sec"] < known["solves_per_sec"] * (1.0 - threshold):
+            regressions.append(f"{key}: solves/sec {found['solves_per_sec']:.0f} < baseline {known['solves_per_sec']:.0f}")
+        if found["evals_per_solve"] > known["evals_per_solve"] * (1.0 + threshold):
+            regressions.append(f"{key}: evals/solve {found['evals_per_solve']} > baseline {known['evals_per_solve']}")
+    return regressions
+
+
+def print_results(results: dict):
+    print(f"{'case':45s} {'solves/sec':>12s} {'evals/solve':>12s} {'overhead ns/iter':>17s} {'peak bytes':>11s}")
+    for key, found in results.items():
+        overhead = "-" if found["overhead_ns_per_iter"] is None else f"{found['overhead_ns_per_iter']:.0f}"
+        print(f"{key:45s} {found['solves_per_sec']:12.0f} {found['evals_per_solve']:12d} {overhead:>17s} {found['peak_memory_bytes']:11.0f}")
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", type=Path, help="write the results to this JSON baseline")
+    parser.add_argument("--compare", type=Path, help="compare the results against this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="relative change that counts as a regression")
+    parser.add_argument("--min-time", type=float, default=0.1, help="minimum time per measurement in seconds")
+    args = parser.parse_args(argv)
+    results = run_benchmarks(args.min_time)
+    print_results(results)
+    if args.save is not None:
+        args.save.write_text(json.dumps(results, indent=2))
+    if args.compare is not None:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
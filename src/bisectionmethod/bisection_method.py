@@ -1,7 +1,23 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from pathlib import Path
-from typing import Callable, Union
+import struct
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, Iterator, List, NamedTuple, Sequence, Tuple, Union
+
+
+PLOT_FUNCTIONS = ("plot_bisection_results", "plot_function_with_inset", "plot_bisection_report")
+
+
+def __getattr__(name: str):
+    """
+    Will import the plotting functions from `bisectionmethod.plotting` on first use,
+    so importing the solvers does not import matplotlib.
+    """
+    if name in PLOT_FUNCTIONS:
+        from bisectionmethod import plotting
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def hello_world():
@@ -98,133 +114,1012 @@ def update_step(fcn: Callable, a: float, b: float, fcn_a: float, fcn_b: float) -
     return a, b, fcn_a, fcn_b
 
 
-def run_bisection_method(fcn: Callable, a: float, b: float, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000) -> dict:
+METHODS = ("bisection", "illinois", "brent", "itp", "multisection")
+
+
+def check_method(method: str):
+    """
+    Given the name of a bracketing method.
+    Will throw an error if the method is not one of METHODS.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Invalid method: {method}. Must be one of {', '.join(METHODS)}.")
+    return True
+
+
+def make_illinois_step(a: float, b: float, fcn_a: float, fcn_b: float) -> Callable:
+    """
+    Given the initial bracket a and b and function evaluations of each.
+    Will return an update step with the same signature as `update_step` that places the new
+    point with regula falsi and halves the stored function value of an endpoint that is
+    retained twice in a row (the Illinois modification).
+    If two steps in a row fail to halve the bracket, the next step is a bisection step, so the method
+    is never more than three times as slow as bisection.
+    The bracket is updated with `update_a_b`, so the returned fcn_a and fcn_b are always true evaluations.
+    """
+    scaled_a = fcn_a
+    scaled_b = fcn_b
+    side = 0
+    widths = [b - a]
+
+    def illinois_step(fcn: Callable, a: float, b: float, fcn_a: float, fcn_b: float) -> Union[float, float, float, float]:
+        nonlocal scaled_a, scaled_b, side
+        c = (a * scaled_b - b * scaled_a) / (scaled_b - scaled_a)
+        if len(widths) > 2 and widths[-1] > widths[-3] / 2.0:
+            c = midpoint(a, b)
+            widths.clear()
+        elif not a < c < b:
+            c = midpoint(a, b)
+        fcn_c = fcn(c)
+        new_a, new_b, new_fcn_a, new_fcn_b = update_a_b(a, b, c, fcn_a, fcn_b, fcn_c)
+        widths.append(new_b - new_a)
+        if new_a == c and new_b == b:
+            scaled_a = fcn_c
+            if side == -1:
+                scaled_b = scaled_b / 2.0
+            side = -1
+        elif new_b == c and new_a == a:
+            scaled_b = fcn_c
+            if side == 1:
+                scaled_a = scaled_a / 2.0
+            side = 1
+        return new_a, new_b, new_fcn_a, new_fcn_b
+
+    return illinois_step
+
+
+def make_brent_step(a: float, b: float, fcn_a: float, fcn_b: float, tol_input: float) -> Callable:
+    """
+    Given the initial bracket a and b, function evaluations of each, and the input tolerance.
+    Will return an update step with the same signature as `update_step` that follows Brent's method:
+    inverse quadratic interpolation or secant steps when they shrink the bracket fast enough,
+    and a bisection step otherwise.
+    Steps are never shorter than a quarter of tol_input so the bracket always collapses below tol_input.
+    If two steps in a row fail to halve the bracket, the next step is a bisection step.
+    """
+    state = {"x_pre": a, "f_pre": fcn_a, "x_cur": b, "f_cur": fcn_b, "x_blk": a, "f_blk": fcn_a, "s_pre": b - a, "s_cur": b - a, "widths": [b - a]}
+
+    def normalize():
+        # keep x_cur as the endpoint with the smallest |f| and x_blk as the opposite end of the bracket
+        if np.sign(state["f_pre"]) != np.sign(state["f_cur"]):
+            state["x_blk"] = state["x_pre"]
+            state["f_blk"] = state["f_pre"]
+            state["s_pre"] = state["s_cur"] = state["x_cur"] - state["x_pre"]
+        if abs(state["f_blk"]) < abs(state["f_cur"]):
+            state["x_pre"], state["f_pre"] = state["x_cur"], state["f_cur"]
+            state["x_cur"], state["f_cur"] = state["x_blk"], state["f_blk"]
+            state["x_blk"], state["f_blk"] = state["x_pre"], state["f_pre"]
+
+    normalize()
+
+    def brent_step(fcn: Callable, a: float, b: float, fcn_a: float, fcn_b: float) -> Union[float, float, float, float]:
+        x_pre, f_pre = state["x_pre"], state["f_pre"]
+        x_cur, f_cur = state["x_cur"], state["f_cur"]
+        x_blk, f_blk = state["x_blk"], state["f_blk"]
+        delta = (tol_input / 2.0 + 4.0 * np.finfo(float).eps * abs(x_cur)) / 2.0
+        s_bis = (x_blk - x_cur) / 2.0
+        widths = state["widths"]
+        if len(widths) > 2 and widths[-1] > widths[-3] / 2.0:
+            state["s_pre"] = state["s_cur"] = s_bis
+            widths.clear()
+        elif abs(state["s_pre"]) > delta and abs(f_cur) < abs(f_pre):
+            if x_pre == x_blk:
+                # secant
+                s_try = -f_cur * (x_cur - x_pre) / (f_cur - f_pre)
+            else:
+                # inverse quadratic interpolation
+                d_pre = (f_pre - f_cur) / (x_pre - x_cur)
+                d_blk = (f_blk - f_cur) / (x_blk - x_cur)
+                s_try = -f_cur * (f_blk * d_blk - f_pre * d_pre) / (d_blk * d_pre * (f_blk - f_pre))
+            if 2.0 * abs(s_try) < min(abs(state["s_pre"]), 3.0 * abs(s_bis) - delta):
+                state["s_pre"] = state["s_cur"]
+                state["s_cur"] = s_try
+            else:
+                state["s_pre"] = state["s_cur"] = s_bis
+        else:
+            state["s_pre"] = state["s_cur"] = s_bis
+        if abs(state["s_cur"]) > delta:
+            c = x_cur + state["s_cur"]
+        else:
+            c = x_cur + np.copysign(delta, s_bis)
+        if not a < c < b:
+            c = midpoint(a, b)
+        fcn_c = fcn(c)
+        state["x_pre"], state["f_pre"] = x_cur, f_cur
+        state["x_cur"], state["f_cur"] = c, fcn_c
+        normalize()
+        widths.append(abs(state["x_blk"] - state["x_cur"]))
+        if fcn_c == 0:
+            return c, c, fcn_c, fcn_c
+        if state["x_cur"] < state["x_blk"]:
+            return state["x_cur"], state["x_blk"], state["f_cur"], state["f_blk"]
+        return state["x_blk"], state["x_cur"], state["f_blk"], state["f_cur"]
+
+    return brent_step
+
+
+def make_itp_step(a: float, b: float, tol_input: float, k_1: float = 0.2, k_2: float = 2.0, n_0: int = 1) -> Callable:
+    """
+    Given the initial bracket a and b and the input tolerance.
+    Will return an update step with the same signature as `update_step` that follows the
+    ITP (interpolate, truncate, project) method of Oliveira and Takahashi.
+    The new point is a truncated regula falsi estimate projected into a shrinking region
+    around the midpoint, which guarantees b - a <= tol_input after at most n_0 iterations more than bisection needs
+    to reach that width, in exact arithmetic. `root_found` needs b - a < tol_input strictly and the new points are
+    rounded to floats, so a solve can take one or two iterations more than that (38 against the 36 of bisection
+    for exp(x) - 10 ** 6 on [0, 50] with tol_input = 10 ** -9).
+    k_1 is relative to the initial interval size.
+    A tol_input of zero is replaced by the float spacing at the bracket, the smallest width bisection can reach.
+    """
+    eps = max(tol_input / 2.0, np.spacing(max(abs(a), abs(b))))
+    k_1 = k_1 / (b - a)
+    n_max = int(np.ceil(np.log2((b - a) / (2.0 * eps)))) + n_0 if b - a > 2.0 * eps else n_0
+    step_num = 0
+
+    def itp_step(fcn: Callable, a: float, b: float, fcn_a: float, fcn_b: float) -> Union[float, float, float, float]:
+        nonlocal step_num
+        x_half = midpoint(a, b)
+        radius = max(eps * 2.0 ** (n_max - step_num) - (b - a) / 2.0, 0.0)
+        delta = k_1 * (b - a) ** k_2
+        x_f = (fcn_b * a - fcn_a * b) / (fcn_b - fcn_a)
+        sigma = np.sign(x_half - x_f)
+        if delta <= abs(x_half - x_f):
+            x_t = x_f + sigma * delta
+        else:
+            x_t = x_half
+        if abs(x_t - x_half) <= radius:
+            c = x_t
+        else:
+            c = x_half - sigma * radius
+        if not a < c < b:
+            c = x_half
+        step_num += 1
+        fcn_c = fcn(c)
+        return update_a_b(a, b, c, fcn_a, fcn_b, fcn_c)
+
+    return itp_step
+
+
+def check_num_sections(num_sections: int):
+    """
+    Given the number of sub-intervals of a multisection step.
+    Will throw an error if there are fewer than two.
+    """
+    if num_sections < 2:
+        raise ValueError(f"Invalid number of sections: {num_sections}. Must be at least 2.")
+    return True
+
+
+def make_executor(executor: Union[str, Executor, None], max_workers: int) -> Tuple[Executor, bool]:
+    """
+    Given "thread", "process", None (same as "thread"), or an existing concurrent.futures Executor, and a number of workers.
+    Will return the executor and whether it was created here (and should be shut down by the caller).
+    The pool classes are imported here, so importing the solvers does not import multiprocessing.
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    if executor is None or executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers), True
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=max_workers), True
+    if isinstance(executor, Executor):
+        return executor, False
+    raise ValueError(f"Invalid executor: {executor}. Must be \"thread\", \"process\", or a concurrent.futures.Executor.")
+
+
+def make_multisection_step(executor: Executor, num_sections: int) -> Callable:
+    """
+    Given a concurrent.futures Executor and the number of sub-intervals k.
+    Will return an update step with the same signature as `update_step` that evaluates the k - 1
+    equally spaced interior points of the bracket concurrently on the executor and keeps the
+    sub-interval with the sign change. Each step shrinks the bracket by a factor of k,
+    which is log2(k) bisection steps per round of concurrent evaluations.
+    If an interior point is an exact root, a and b will both be assigned to it.
+    """
+    check_num_sections(num_sections)
+
+    def multisection_step(fcn: Callable, a: float, b: float, fcn_a: float, fcn_b: float) -> Union[float, float, float, float]:
+        width = b - a
+        points = [a] + [a + width * kk / num_sections for kk in range(1, num_sections)] + [b]
+        values = [fcn_a] + list(executor.map(fcn, points[1:-1])) + [fcn_b]
+        for kk in range(0, num_sections):
+            if values[kk] == 0:
+                return points[kk], points[kk], values[kk], values[kk]
+            if values[kk + 1] == 0:
+                return points[kk + 1], points[kk + 1], values[kk + 1], values[kk + 1]
+            if (values[kk] < 0 and values[kk + 1] > 0) or (values[kk] > 0 and values[kk + 1] < 0):
+                return points[kk], points[kk + 1], values[kk], values[kk + 1]
+        raise ValueError("The function evaluations must have one positive and one negative value.")
+
+    return multisection_step
+
+
+def make_update_step(method: str, a: float, b: float, fcn_a: float, fcn_b: float, tol_input: float, executor: Executor = None, num_sections: int = 4) -> Callable:
+    """
+    Given the name of a bracketing method, the initial bracket and function evaluations, and the input tolerance.
+    For "multisection", also given the Executor that evaluates interior points and the number of sub-intervals.
+    Will return an update step with the same signature as `update_step` for that method.
+    """
+    check_method(method)
+    if method == "illinois":
+        return make_illinois_step(a, b, fcn_a, fcn_b)
+    if method == "brent":
+        return make_brent_step(a, b, fcn_a, fcn_b, tol_input)
+    if method == "itp":
+        return make_itp_step(a, b, tol_input)
+    if method == "multisection":
+        return make_multisection_step(executor, num_sections)
+    return update_step
+
+
+HISTORY_MODES = ("list", "none", "array", "last_k")
+
+
+def check_history(history: str):
+    """
+    Given the name of a history storage mode.
+    Will throw an error if the mode is not one of HISTORY_MODES.
+    """
+    if history not in HISTORY_MODES:
+        raise ValueError(f"Invalid history: {history}. Must be one of {', '.join(HISTORY_MODES)}.")
+    return True
+
+
+def bisection_iter_bound(a: float, b: float, tol_input: float) -> int:
+    """
+    Given points a and b and the input tolerance.
+    Will return the number of bisection iterations needed to make |b - a| < tol_input.
+    Will throw an error if tol_input is not positive, since |b - a| < tol_input is then never reached.
+    """
+    if tol_input <= 0:
+        raise ValueError(f"Invalid input: tol_input must be positive to bound the iterations, found {tol_input}.")
+    if b - a < tol_input:
+        return 0
+    return int(np.floor(np.log2((b - a) / tol_input))) + 1
+
+
+class ListHistory:
+    """
+    Stores every a, b, fcn_a and fcn_b in Python lists.
+    """
+    __slots__ = ("all_a", "all_fcn_a", "all_b", "all_fcn_b")
+
+    def __init__(self):
+        self.all_a = []
+        self.all_fcn_a = []
+        self.all_b = []
+        self.all_fcn_b = []
+
+    def append(self, a: float, b: float, fcn_a: float, fcn_b: float):
+        self.all_a.append(a)
+        self.all_fcn_a.append(fcn_a)
+        self.all_b.append(b)
+        self.all_fcn_b.append(fcn_b)
+
+    def values(self) -> tuple:
+        return self.all_a, self.all_fcn_a, self.all_b, self.all_fcn_b
+
+
+class NoHistory:
+    """
+    Stores nothing, only the final state of the solver is kept.
+    """
+    __slots__ = ()
+
+    def append(self, a: float, b: float, fcn_a: float, fcn_b: float):
+        return
+
+    def values(self) -> tuple:
+        return None, None, None, None
+
+
+class ArrayHistory:
+    """
+    Stores every a, fcn_a, b and fcn_b in a preallocated NumPy buffer.
+    The buffer doubles in size if the solver needs more entries than the given capacity.
+    """
+    __slots__ = ("buffer", "size")
+
+    def __init__(self, capacity: int):
+        self.buffer = np.empty((4, max(capacity, 1)))
+        self.size = 0
+
+    def append(self, a: float, b: float, fcn_a: float, fcn_b: float):
+        if self.size == self.buffer.shape[1]:
+            self.buffer = np.concatenate((self.buffer, np.empty_like(self.buffer)), axis=1)
+        column = self.buffer[:, self.size]
+        column[0] = a
+        column[1] = fcn_a
+        column[2] = b
+        column[3] = fcn_b
+        self.size += 1
+
+    def values(self) -> tuple:
+        return tuple(self.buffer[:, :self.size])
+
+
+class RingHistory:
+    """
+    Stores the last `capacity` values of a, fcn_a, b and fcn_b in a NumPy ring buffer.
+    """
+    __slots__ = ("buffer", "size")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError(f"Invalid history size: {capacity}. Must be at least 1.")
+        self.buffer = np.empty((4, capacity))
+        self.size = 0
+
+    def append(self, a: float, b: float, fcn_a: float, fcn_b: float):
+        column = self.buffer[:, self.size % self.buffer.shape[1]]
+        column[0] = a
+        column[1] = fcn_a
+        column[2] = b
+        column[3] = fcn_b
+        self.size += 1
+
+    def values(self) -> tuple:
+        capacity = self.buffer.shape[1]
+        if self.size <= capacity:
+            return tuple(self.buffer[:, :self.size])
+        return tuple(np.roll(self.buffer, -(self.size % capacity), axis=1))
+
+
+def make_history(history: str, a: float, b: float, tol_input: float, max_num_iter: int, history_size: int):
+    """
+    Given a history storage mode, the initial bracket, the input tolerance, the maximum number of iterations
+    and the ring buffer size.
+    Will return an object with `append(a, b, fcn_a, fcn_b)` and `values()` that stores the bracket history.
+    "array" buffers are sized from `bisection_iter_bound` so bisection never has to grow them, or from
+    max_num_iter if tol_input is not positive.
+    """
+    check_history(history)
+    if history == "none":
+        return NoHistory()
+    if history == "array":
+        if tol_input <= 0:
+            return ArrayHistory(max_num_iter + 2)
+        return ArrayHistory(min(bisection_iter_bound(a, b, tol_input), max_num_iter + 1) + 1)
+    if history == "last_k":
+        return RingHistory(history_size)
+    return ListHistory()
+
+
+class BisectionResult:
+    """
+    Result of `run_bisection_method`.
+    Fields can be read as attributes or like a dictionary (e.g. result["solution"]),
+    so code written for the dictionary result keeps working.
+    The "all_*" fields are None when the history is not stored.
+    """
+    __slots__ = ("solution", "num_iter", "num_eval", "all_a", "all_fcn_a", "all_b", "all_fcn_b")
+
+    def __init__(self, solution: float, num_iter: int, num_eval: int, all_a=None, all_fcn_a=None, all_b=None, all_fcn_b=None):
+        self.solution = solution
+        self.num_iter = num_iter
+        self.num_eval = num_eval
+        self.all_a = all_a
+        self.all_fcn_a = all_fcn_a
+        self.all_b = all_b
+        self.all_fcn_b = all_fcn_b
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def keys(self) -> tuple:
+        return self.__slots__
+
+    def to_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"BisectionResult(solution={self.solution!r}, num_iter={self.num_iter!r}, num_eval={self.num_eval!r})"
+
+
+class BisectionStep(NamedTuple):
+    """
+    One step of `iter_bisection`: the bracket, its function evaluations, the iteration number,
+    and the number of calls to fcn so far.
+    """
+    a: float
+    b: float
+    fcn_a: float
+    fcn_b: float
+    iteration: int
+    num_eval: int
+
+    def state(self) -> dict:
+        """
+        Will return a JSON-serializable dictionary that `iter_bisection` can resume from.
+        """
+        return {"a": float(self.a), "b": float(self.b), "fcn_a": float(self.fcn_a), "fcn_b": float(self.fcn_b), "iteration": int(self.iteration), "num_eval": int(self.num_eval)}
+
+
+def iter_bisection(fcn: Callable, a: float = None, b: float = None, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, method: str = "bisection", num_sections: int = 4, executor: Union[str, Executor, None] = None, state: dict = None) -> Iterator[BisectionStep]:
     """
+    Given a continuous function, bounds a and b, tolerances, a maximum number of iterations, and a method
+    (see `run_bisection_method`).
+    Will lazily yield a BisectionStep for the initial bracket and after every iteration, until `root_found` is satisfied.
+    The caller can stop early at any step. `step.state()` is a JSON-serializable checkpoint, and passing it as state
+    (instead of a and b) resumes the solve after that step without evaluating fcn again.
+    Resuming is exact for "bisection" and "multisection". The other methods restart their interpolation from the
+    checkpointed bracket, which keeps the bracket guarantee.
+    Errors are raised when the first step is requested.
     """
+    check_method(method)
+    if method == "multisection":
+        check_num_sections(num_sections)
+    if state is None:
+        check_a_less_b(a, b)
+        fcn_a = fcn(a)
+        fcn_b = fcn(b)
+        check_sign_compatible(a, b, fcn_a, fcn_b)
+        num_iter = 0
+        num_eval = 2
+        yield BisectionStep(a, b, fcn_a, fcn_b, num_iter, num_eval)
+    else:
+        a, b, fcn_a, fcn_b, num_iter, num_eval = [state[key] for key in BisectionStep._fields]
+    pool, owns_pool = None, False
+    eval_per_iter = 1
+    if method == "multisection":
+        pool, owns_pool = make_executor(executor, num_sections - 1)
+        eval_per_iter = num_sections - 1
+    try:
+        step = make_update_step(method, a, b, fcn_a, fcn_b, tol_input, pool, num_sections)
+        while root_found(a, b, fcn_a, fcn_b, tol_input, tol_output) is False:
+            check_max_iter(num_iter, max_num_iter)
+            num_iter += 1
+            a, b, fcn_a, fcn_b = step(fcn, a, b, fcn_a, fcn_b)
+            num_eval += eval_per_iter
+            yield BisectionStep(a, b, fcn_a, fcn_b, num_iter, num_eval)
+    finally:
+        if owns_pool:
+            pool.shutdown()
+
+
+class TimedFunction:
+    """
+    Wraps a function and adds the wall-clock time and number of its calls to a SolverInstrument.
+    """
+    __slots__ = ("fcn", "instrument")
+
+    def __init__(self, fcn: Callable, instrument: "SolverInstrument"):
+        self.fcn = fcn
+        self.instrument = instrument
+
+    def __call__(self, x: float) -> float:
+        start = time.perf_counter()
+        value = self.fcn(x)
+        self.instrument.eval_time += time.perf_counter() - start
+        self.instrument.num_eval += 1
+        return value
+
+
+class SolverInstrument:
+    """
+    Collects statistics across every solve of `run_bisection_method` that is passed instrument=this object:
+    the number of solves and failures, iterations, evaluations of fcn, total time, the time spent in fcn,
+    and how many solves needed at least near_max_fraction of max_num_iter.
+    callback (optional) is called with every BisectionStep, and subclasses can override on_start, on_step and on_finish.
+    Evaluation time is only measured for calls in this process, so it is not measured with executor="process",
+    and with threads it is summed over threads.
+    """
+
+    def __init__(self, callback: Callable = None, near_max_fraction: float = 0.9):
+        self.callback = callback
+        self.near_max_fraction = near_max_fraction
+        self.reset()
+
+    def reset(self):
+        self.num_solve = 0
+        self.num_failed = 0
+        self.num_near_max_iter = 0
+        self.num_iter = 0
+        self.num_eval = 0
+        self.total_time = 0.0
+        self.eval_time = 0.0
+        self.start_time = None
+
+    def wrap(self, fcn: Callable) -> TimedFunction:
+        return TimedFunction(fcn, self)
+
+    def on_start(self):
+        self.start_time = time.perf_counter()
+
+    def on_step(self, step: BisectionStep):
+        if self.callback is not None:
+            self.callback(step)
+
+    def on_finish(self, num_iter: int, max_num_iter: int, failed: bool = False):
+        self.total_time += time.perf_counter() - self.start_time
+        self.num_solve += 1
+        self.num_iter += num_iter
+        if failed:
+            self.num_failed += 1
+        if num_iter >= self.near_max_fraction * max_num_iter:
+            self.num_near_max_iter += 1
+
+    def stats(self) -> dict:
+        """
+        Will return the aggregate statistics as a dictionary. "overhead_time" is the solve time not spent in fcn.
+        """
+        return {"num_solve": self.num_solve,
+                "num_failed": self.num_failed,
+                "num_near_max_iter": self.num_near_max_iter,
+                "num_iter": self.num_iter,
+                "num_eval": self.num_eval,
+                "total_time": self.total_time,
+                "eval_time": self.eval_time,
+                "overhead_time": self.total_time - self.eval_time,
+                "mean_iter": self.num_iter / self.num_solve if self.num_solve > 0 else 0.0}
+
+
+def run_bisection_method(fcn: Callable, a: float, b: float, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, method: str = "bisection", history: str = "list", history_size: int = 10, num_sections: int = 4, executor: Union[str, Executor, None] = None, instrument: SolverInstrument = None) -> BisectionResult:
+    """
+    Given a continuous function, bounds a and b, tolerances, and a maximum number of iterations.
+    Will shrink the bracket [a, b] with the chosen method until `root_found` is satisfied, by consuming `iter_bisection`.
+    method is one of METHODS. "bisection" halves the bracket every iteration. "illinois", "brent" and "itp"
+    keep the same guaranteed bracket but usually need far fewer evaluations of fcn.
+    "multisection" splits the bracket into num_sections sub-intervals every iteration (round) and evaluates
+    the interior points concurrently on executor: "thread" (default), "process" (fcn must be picklable),
+    or any concurrent.futures Executor, which is not shut down.
+    history is one of HISTORY_MODES and controls how the bracket history is stored:
+        - "list": Python lists of every iteration
+        - "none": nothing, only the final state is kept
+        - "array": NumPy arrays of every iteration
+        - "last_k": NumPy arrays of the last history_size iterations
+    instrument (optional) is a SolverInstrument that times the solve and fcn, counts evaluations, and receives
+    every step. Without it, the solve loop is not changed.
+    Will return a BisectionResult with "solution", "num_iter" (the number of rounds), "num_eval" (the number
+    of calls to fcn), and the bracket history "all_a", "all_fcn_a", "all_b", "all_fcn_b".
+    """
+    check_history(history)
+    trace = make_history(history, a, b, tol_input, max_num_iter, history_size)
+    if instrument is None:
+        for step in iter_bisection(fcn, a, b, tol_input, tol_output, max_num_iter, method, num_sections, executor):
+            trace.append(step.a, step.b, step.fcn_a, step.fcn_b)
+    else:
+        instrument.on_start()
+        step = None
+        try:
+            for step in iter_bisection(instrument.wrap(fcn), a, b, tol_input, tol_output, max_num_iter, method, num_sections, executor):
+                trace.append(step.a, step.b, step.fcn_a, step.fcn_b)
+                instrument.on_step(step)
+        except ValueError:
+            instrument.on_finish(0 if step is None else step.iteration, max_num_iter, failed=True)
+            raise
+        instrument.on_finish(step.iteration, max_num_iter)
+    final_root = midpoint(step.a, step.b)
+    all_a, all_fcn_a, all_b, all_fcn_b = trace.values()
+    result = BisectionResult(final_root, step.iteration, step.num_eval, all_a, all_fcn_a, all_b, all_fcn_b)
+    return result
+
+
+async def run_bisection_method_async(fcn: Callable[[float], Awaitable[float]], a: float, b: float, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, history: str = "list", history_size: int = 10) -> BisectionResult:
+    """
+    Given a coroutine function, bounds a and b, tolerances, and a maximum number of iterations.
+    Will run the bisection method exactly like `run_bisection_method`, awaiting fcn at every evaluation,
+    so many solves can share one event loop.
+    Will return a BisectionResult with "solution", "num_iter", "num_eval" and the bracket history.
+    """
+    check_history(history)
     check_a_less_b(a, b)
-    fcn_a = fcn(a)
-    fcn_b = fcn(b)
+    fcn_a = await fcn(a)
+    fcn_b = await fcn(b)
     check_sign_compatible(a, b, fcn_a, fcn_b)
+    trace = make_history(history, a, b, tol_input, max_num_iter, history_size)
     num_iter = 0
-    a_list = []
-    b_list = []
-    fcn_a_list = []
-    fcn_b_list = []
-    a_list.append(a)
-    b_list.append(b)
-    fcn_a_list.append(fcn_a)
-    fcn_b_list.append(fcn_b)
+    trace.append(a, b, fcn_a, fcn_b)
     while root_found(a, b, fcn_a, fcn_b, tol_input, tol_output) is False:
         check_max_iter(num_iter, max_num_iter)
         num_iter += 1
-        a, b, fcn_a, fcn_b = update_step(fcn, a, b, fcn_a, fcn_b)
-        a_list.append(a)
-        b_list.append(b)
-        fcn_a_list.append(fcn_a)
-        fcn_b_list.append(fcn_b)
+        c = midpoint(a, b)
+        fcn_c = await fcn(c)
+        a, b, fcn_a, fcn_b = update_a_b(a, b, c, fcn_a, fcn_b, fcn_c)
+        trace.append(a, b, fcn_a, fcn_b)
     final_root = midpoint(a, b)
-    result = {"solution": final_root,
-              "num_iter": num_iter,
-              "all_a": a_list,
-              "all_fcn_a": fcn_a_list,
-              "all_b": b_list,
-              "all_fcn_b": fcn_b_list}
+    all_a, all_fcn_a, all_b, all_fcn_b = trace.values()
+    result = BisectionResult(final_root, num_iter, num_iter + 2, all_a, all_fcn_a, all_b, all_fcn_b)
     return result
 
 
-def plot_bisection_results(result: dict, fig_name_with_path: Path):
-    """
-    Plots the results of the bisection method.
-    
-    Parameters:
-        result (dict): Output dictionary from the `run_bisection_method` function, containing:
-            - "all_a": List of all intermediate a values
-            - "all_b": List of all intermediate b values
-            - "num_iter": Number of iterations
-    """
-    a_values = result["all_a"]
-    b_values = result["all_b"]
-    num_iter = result["num_iter"]
-    final_root = result["solution"]
-
-    # Compute midpoint values for visualization
-    midpoints = [(a + b) / 2.0 for a, b in zip(a_values, b_values)]
-    
-    # Compute interval sizes
-    interval_sizes = [b - a for a, b in zip(a_values, b_values)]
-    
-    # Plot a and b values over iterations
-    fig, axs = plt.subplots(1, 2, figsize=(9, 4))
-    axs[0].plot(range(0, num_iter + 1), a_values, marker="o", color="red", label="a values", linestyle="--")
-    axs[0].plot(range(0, num_iter + 1), b_values, marker="s", color="blue", label="b values", linestyle="--")
-    axs[0].plot(range(0, num_iter + 1), midpoints, marker=".", color="cyan", label="Midpoints", linestyle="-")
-    axs[0].scatter([num_iter], [final_root], color="yellow", label="Root: %0.6f" % (final_root), s=200, edgecolors="black")
-    axs[0].set_xlabel("Iteration")
-    axs[0].set_ylabel("Value")
-    axs[0].set_title("Convergence of a, b, and Midpoints")
-    axs[0].legend()
-    axs[0].grid(True)
-    
-    # Plot interval sizes over iterations
-    axs[1].plot(range(0, num_iter + 1), interval_sizes, marker="o", color="black", linestyle="-")
-    axs[1].set_yscale("log")
-    axs[1].set_xlabel("Iteration")
-    axs[1].set_ylabel("Interval Size (log scale)")
-    axs[1].set_title("Convergence of Interval Size")
-    axs[1].grid(True)
-
-    plt.tight_layout()
-    plt.savefig(fig_name_with_path)
-    return
+async def run_bisection_batch_async(fcn: Callable[[float], Awaitable[float]], a: Sequence[float], b: Sequence[float], tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, max_concurrency: int = 64, history: str = "none") -> List[Union[BisectionResult, ValueError]]:
+    """
+    Given a coroutine function and sequences of lower and upper bounds.
+    Will interleave `run_bisection_method_async` solves for every bracket on the running event loop,
+    with at most max_concurrency solves in flight at any time.
+    Will return a list with one entry per bracket, in input order: the BisectionResult, or the ValueError
+    that `run_bisection_method` would have raised for that bracket. Other exceptions propagate.
+    """
+    import asyncio
+    if max_concurrency < 1:
+        raise ValueError(f"Invalid max_concurrency: {max_concurrency}. Must be at least 1.")
+    semaphore = asyncio.Semaphore(max_concurrency)
 
+    async def solve(a_single: float, b_single: float) -> Union[BisectionResult, ValueError]:
+        async with semaphore:
+            try:
+                return await run_bisection_method_async(fcn, a_single, b_single, tol_input, tol_output, max_num_iter, history)
+            except ValueError as error:
+                return error
+
+    return await asyncio.gather(*[solve(a_single, b_single) for a_single, b_single in zip(a, b)])
+
+
+def float_to_ordered_int(x: float) -> int:
+    """
+    Given a float.
+    Will return an integer with the same order as the IEEE 754 doubles, so adjacent doubles map to adjacent integers.
+    0.0 and -0.0 both map to 0.
+    """
+    bits = struct.unpack("<q", struct.pack("<d", x))[0]
+    if bits < 0:
+        return -(bits & 0x7FFFFFFFFFFFFFFF)
+    return bits
+
+
+def ordered_int_to_float(key: int) -> float:
+    """
+    Given an integer from `float_to_ordered_int`.
+    Will return the corresponding float.
+    """
+    if key < 0:
+        key = -key | -0x8000000000000000
+    return struct.unpack("<d", struct.pack("<q", key))[0]
+
+
+def float_bits_iter_bound(a: float, b: float, tol_input: float = 0.0) -> int:
+    """
+    Given points a and b and (optional) the input tolerance.
+    Will return the maximum number of iterations of `run_bisection_float_bits` on [a, b],
+    which is ceil(log2(number of doubles in [a, b] - 1)) and never more than 64.
+    With a positive tol_input, the bound also stops at the first iteration where every possible bracket is narrower
+    than tol_input: a bracket of n gaps between doubles is at most n times the largest float spacing in [a, b] wide.
+    """
+    num_gaps = float_to_ordered_int(b) - float_to_ordered_int(a)
+    if num_gaps <= 1:
+        return 0
+    bound = (num_gaps - 1).bit_length()
+    # number of gaps that is always narrower than tol_input, the widest gap is the one below max(|a|, |b|)
+    magnitude = max(abs(a), abs(b))
+    max_gaps = int(np.ceil(tol_input / (magnitude - np.nextafter(magnitude, 0.0)))) - 1 if 0 < tol_input < np.inf else 0
+    if max_gaps >= 1:
+        bound = min(bound, ((num_gaps - 1) // max_gaps).bit_length())
+    return bound
+
+
+def run_bisection_float_bits(fcn: Callable, a: float, b: float, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, history: str = "list", history_size: int = 10) -> BisectionResult:
+    """
+    Given a continuous function, bounds a and b, and tolerances.
+    Will run the bisection method on the ordered integer representation of the doubles in [a, b]
+    (see `float_to_ordered_int`), stopping when `root_found` is satisfied or when a and b are adjacent doubles.
+    Every iteration halves the number of doubles in the bracket, so the solve never takes more than
+    `float_bits_iter_bound(a, b, tol_input)` iterations (at most 64), even if tol_input is below the float spacing
+    near the root or zero.
+    Within one binade the bracket is split at the same points as `run_bisection_method`, up to rounding
+    in the last bit. Brackets that span many binades are split
+    in the middle of their exponent range first, which takes more iterations to reach a loose tolerance.
+    Will return a BisectionResult with "solution", "num_iter", "num_eval" and the bracket history.
+    """
+    check_history(history)
+    if not (np.isfinite(a) and np.isfinite(b)):
+        raise ValueError(f"Invalid input: {a} and {b} must be finite.")
+    check_a_less_b(a, b)
+    a = float(a)
+    b = float(b)
+    fcn_a = fcn(a)
+    fcn_b = fcn(b)
+    check_sign_compatible(a, b, fcn_a, fcn_b)
+    max_num_iter = float_bits_iter_bound(a, b, tol_input)
+    if history == "array":
+        trace = ArrayHistory(max_num_iter + 1)
+    else:
+        trace = make_history(history, a, b, tol_input, max_num_iter, history_size)
+    key_a = float_to_ordered_int(a)
+    key_b = float_to_ordered_int(b)
+    num_iter = 0
+    trace.append(a, b, fcn_a, fcn_b)
+    while key_b - key_a > 1 and root_found(a, b, fcn_a, fcn_b, tol_input, tol_output) is False:
+        num_iter += 1
+        c = ordered_int_to_float((key_a + key_b) // 2)
+        fcn_c = fcn(c)
+        a, b, fcn_a, fcn_b = update_a_b(a, b, c, fcn_a, fcn_b, fcn_c)
+        key_a = float_to_ordered_int(a)
+        key_b = float_to_ordered_int(b)
+        trace.append(a, b, fcn_a, fcn_b)
+    final_root = midpoint(a, b)
+    all_a, all_fcn_a, all_b, all_fcn_b = trace.values()
+    result = BisectionResult(final_root, num_iter, num_iter + 2, all_a, all_fcn_a, all_b, all_fcn_b)
+    return result
+
+
+class EvaluationCache:
+    """
+    Wraps a function of one float with a bounded least-recently-used cache of its evaluations.
+    Pass it as fcn to the solvers and to `plot_function_with_inset` so that no point is evaluated twice,
+    including endpoints shared by repeated solves on overlapping brackets.
+    Hits and misses are counted and reported by `cache_info`.
+    """
+    __slots__ = ("fcn", "maxsize", "hits", "misses", "values")
+
+    def __init__(self, fcn: Callable, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError(f"Invalid cache size: {maxsize}. Must be at least 1.")
+        self.fcn = fcn
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.values = OrderedDict()
+
+    def __call__(self, x: float) -> float:
+        key = float(x)
+        values = self.values
+        if key in values:
+            self.hits += 1
+            values.move_to_end(key)
+            return values[key]
+        self.misses += 1
+        value = self.fcn(x)
+        values[key] = value
+        if len(values) > self.maxsize:
+            values.popitem(last=False)
+        return value
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def cache_info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.values), "maxsize": self.maxsize}
+
+    def cache_clear(self):
+        self.values.clear()
+        self.hits = 0
+        self.misses = 0
 
-def plot_function_with_inset(fcn, result: dict, fig_name_with_path: Path):
-    """
-    Plots the original function and visualizes the evolution of `a` and `b` 
-    with an inset plot zoomed in around the root.
-
-    Parameters:
-        fcn (callable): The function being solved using the bisection method.
-        a_values (list): List of `a` values from the iterations.
-        b_values (list): List of `b` values from the iterations.
-        result (dict): Output dictionary from `run_bisection_method` containing:
-            - "solution": The computed root.
-    """
-    # Extract the root and define a range around it for better visualization
-    root = result["solution"]
-    a_values = result["all_a"]
-    b_values = result["all_b"]
-    x_range = np.linspace(min(a_values) - 1, max(b_values) + 1, 1000)
-    y_values = [fcn(x) for x in x_range]
-    
-    # Main plot: Original function
-    plt.figure(figsize=(6, 4))
-    plt.plot(x_range, y_values, label="f(x)", color="black")
-    plt.axhline(0, color="black", linestyle="--", linewidth=0.8)  # Horizontal line at y=0
-    plt.scatter(a_values, [fcn(a) for a in a_values], marker="o", color="red", label="a values", zorder=5)
-    plt.scatter(b_values, [fcn(b) for b in b_values], marker="s", color="blue", label="b values", zorder=5)
-    plt.scatter([root], [fcn(root)], color="yellow", label="Root", zorder=10, s=100, edgecolors="black")
-    plt.xlabel("x")
-    plt.ylabel("f(x)")
-    plt.title("Function Plot with Iterations of a and b")
-    plt.legend()
-    plt.grid(True)
-    
-    # Inset plot: Zoomed-in view around the root
-    ax_inset = plt.gca().inset_axes([0.6, 0.6, 0.3, 0.3])  # Define inset position and size
-    zoom_range = np.linspace(root - 0.5, root + 0.5, 500)
-    zoom_y_values = [fcn(x) for x in zoom_range]
-    ax_inset.plot(zoom_range, zoom_y_values, color="black")
-    ax_inset.scatter(a_values, [fcn(a) for a in a_values], marker="o", color="red", s=10)
-    ax_inset.scatter(b_values, [fcn(b) for b in b_values], marker="s", color="blue", s=10)
-    ax_inset.scatter([root], [fcn(root)], color="yellow", s=50, edgecolors="black")
-    ax_inset.axhline(0, color="black", linestyle="--", linewidth=0.8)
-    ax_inset.set_xlim(root - 0.1, root + 0.1)
-    ax_inset.set_ylim(-0.1, 0.1)
-    ax_inset.set_title("Zoomed-in View of Root")
-    ax_inset.grid(True)
-    
-    plt.tight_layout()
-    plt.savefig(fig_name_with_path)
-    return
 
+def run_bisection_fast(fcn: Callable, a: float, b: float, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, validate: bool = True) -> BisectionResult:
+    """
+    Given a continuous function, bounds a and b, tolerances, and a maximum number of iterations.
+    Will run the bisection method in a single fused loop on plain Python floats, with the same
+    termination semantics, solution and number of iterations as `run_bisection_method`.
+    No history is stored. With validate=False the checks of `check_a_less_b` and `check_sign_compatible`
+    are skipped, which is only safe for trusted inputs.
+    Will return a BisectionResult with "solution", "num_iter" and "num_eval".
+    """
+    if validate:
+        check_a_less_b(a, b)
+    fcn_a = fcn(a)
+    fcn_b = fcn(b)
+    if validate:
+        check_sign_compatible(a, b, fcn_a, fcn_b)
+    # a always keeps the sign of the initial fcn_a
+    a_positive = fcn_a > 0
+    num_iter = 0
+    while not (abs(a - b) < tol_input or abs(fcn_a) + abs(fcn_b) < tol_output):
+        if num_iter > max_num_iter:
+            raise ValueError(f"Maximum number of iterations ({max_num_iter}) reached without convergence")
+        num_iter += 1
+        c = (a + b) / 2.0
+        fcn_c = fcn(c)
+        if fcn_c > 0:
+            if a_positive:
+                a, fcn_a = c, fcn_c
+            else:
+                b, fcn_b = c, fcn_c
+        elif fcn_c < 0:
+            if a_positive:
+                b, fcn_b = c, fcn_c
+            else:
+                a, fcn_a = c, fcn_c
+        elif fcn_c == 0:
+            a = b = c
+            fcn_a = fcn_b = fcn_c
+        else:
+            raise ValueError("The function evaluations must have one positive and one negative value.")
+    result = BisectionResult((a + b) / 2.0, num_iter, num_iter + 2)
+    return result
+
+
+STATUS_CONVERGED = 0
+STATUS_INVALID_INTERVAL = 1
+STATUS_SIGN_INCOMPATIBLE = 2
+STATUS_MAX_ITER = 3
+
+
+def root_found_batch(a: np.ndarray, b: np.ndarray, fcn_a: np.ndarray, fcn_b: np.ndarray, tol_input: float, tol_output: float) -> np.ndarray:
+    """
+    Given arrays of endpoints a and b, their function evaluations, and the desired tolerance.
+    Will return a boolean array that is "True" for every lane where `root_found` would return "True".
+    """
+    val_input = np.abs(a - b)
+    val_output = np.abs(fcn_a) + np.abs(fcn_b)
+    return (val_input < tol_input) | (val_output < tol_output)
+
+
+def update_a_b_batch(a: np.ndarray, b: np.ndarray, c: np.ndarray, fcn_a: np.ndarray, fcn_b: np.ndarray, fcn_c: np.ndarray) -> Union[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Given arrays of endpoints a and b, midpoints c, and function evaluations of each.
+    Will apply the `update_a_b` rules lane by lane and return new a, b, fcn_a, fcn_b.
+    Will also return a boolean array marking lanes where the evaluations no longer have
+    one positive and one negative value (the cases where `update_a_b` would fail).
+    """
+    sign_a = np.sign(fcn_a)
+    sign_b = np.sign(fcn_b)
+    sign_c = np.sign(fcn_c)
+    zero_c = fcn_c == 0
+    zero_a = ~zero_c & (fcn_a == 0)
+    zero_b = ~zero_c & ~zero_a & (fcn_b == 0)
+    nonzero = ~(zero_c | zero_a | zero_b)
+    move_a = nonzero & (sign_a == sign_c)
+    move_b = nonzero & ~move_a & (sign_b == sign_c)
+    invalid = (sign_a == sign_b) | (nonzero & ~move_a & ~move_b)
+    new_a = np.where(zero_c | move_a, c, np.where(zero_b, b, a))
+    new_b = np.where(zero_c | move_b, c, np.where(zero_a, a, b))
+    new_fcn_a = np.where(zero_c | move_a, fcn_c, np.where(zero_b, fcn_b, fcn_a))
+    new_fcn_b = np.where(zero_c | move_b, fcn_c, np.where(zero_a, fcn_a, fcn_b))
+    return new_a, new_b, new_fcn_a, new_fcn_b, invalid
+
+
+def run_bisection_batch(fcn: Callable, a: np.ndarray, b: np.ndarray, tol_input: Union[float, np.ndarray] = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, args: Sequence[np.ndarray] = ()) -> dict:
+    """
+    Given a vectorized continuous function and arrays of lower and upper bounds.
+    args (optional) are arrays of per-lane parameters with the shape of a and b; fcn is then called as
+    fcn(x, *args) with the parameters of the lanes being evaluated. tol_input may also be an array of per-lane tolerances.
+    Will run the bisection method on every bracket at once, advancing all unconverged lanes
+    with a single call to `fcn` per iteration and retiring lanes as soon as they converge.
+    Per lane, the solution and number of iterations match `run_bisection_method`.
+    Lanes that would raise a ValueError in `run_bisection_method` are reported through
+    "status" instead of raising for the whole batch:
+        - STATUS_CONVERGED: the root was found
+        - STATUS_INVALID_INTERVAL: a >= b
+        - STATUS_SIGN_INCOMPATIBLE: fcn(a) and fcn(b) do not have opposite signs
+        - STATUS_MAX_ITER: the maximum number of iterations was reached without convergence
+    Will return a dictionary with arrays "solution" (NaN where not converged), "num_iter" and "status".
+    """
+    a, b, tol_input, *args = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float), np.asarray(tol_input, dtype=float), *[np.asarray(arg) for arg in args])
+    shape = a.shape
+    a = a.ravel()
+    b = b.ravel()
+    tol_input = tol_input.ravel()
+    args = [arg.ravel() for arg in args]
+    solution = np.full(a.size, np.nan)
+    num_iter = np.zeros(a.size, dtype=int)
+    status = np.full(a.size, STATUS_CONVERGED, dtype=int)
+    # check_a_less_b per lane, fcn is only evaluated on valid intervals
+    valid = a < b
+    status[~valid] = STATUS_INVALID_INTERVAL
+    lanes = np.flatnonzero(valid)
+    a = a[lanes]
+    b = b[lanes]
+    fcn_a = np.asarray(fcn(a, *[arg[lanes] for arg in args]), dtype=float)
+    fcn_b = np.asarray(fcn(b, *[arg[lanes] for arg in args]), dtype=float)
+    # check_sign_compatible per lane
+    compatible = ((fcn_a > 0) & (fcn_b < 0)) | ((fcn_a < 0) & (fcn_b > 0))
+    status[lanes[~compatible]] = STATUS_SIGN_INCOMPATIBLE
+    lanes = lanes[compatible]
+    a = a[compatible]
+    b = b[compatible]
+    fcn_a = fcn_a[compatible]
+    fcn_b = fcn_b[compatible]
+    lane_iter = 0
+    while lanes.size > 0:
+        done = root_found_batch(a, b, fcn_a, fcn_b, tol_input[lanes], tol_output)
+        solution[lanes[done]] = midpoint(a[done], b[done])
+        num_iter[lanes[done]] = lane_iter
+        keep = ~done
+        # every active lane has the same number of iterations, so check_max_iter applies to all of them
+        if lane_iter > max_num_iter:
+            status[lanes[keep]] = STATUS_MAX_ITER
+            num_iter[lanes[keep]] = lane_iter
+            break
+        lanes = lanes[keep]
+        a = a[keep]
+        b = b[keep]
+        fcn_a = fcn_a[keep]
+        fcn_b = fcn_b[keep]
+        if lanes.size == 0:
+            break
+        lane_iter += 1
+        c = midpoint(a, b)
+        fcn_c = np.asarray(fcn(c, *[arg[lanes] for arg in args]), dtype=float)
+        a, b, fcn_a, fcn_b, invalid = update_a_b_batch(a, b, c, fcn_a, fcn_b, fcn_c)
+        if np.any(invalid):
+            status[lanes[invalid]] = STATUS_SIGN_INCOMPATIBLE
+            num_iter[lanes[invalid]] = lane_iter
+            keep = ~invalid
+            lanes = lanes[keep]
+            a = a[keep]
+            b = b[keep]
+            fcn_a = fcn_a[keep]
+            fcn_b = fcn_b[keep]
+    result = {"solution": solution.reshape(shape),
+              "num_iter": num_iter.reshape(shape),
+              "status": status.reshape(shape)}
+    return result
+
+
+def evaluate_grid(fcn: Callable, x: np.ndarray, vectorized: bool = True) -> np.ndarray:
+    """
+    Given a function and an array of points.
+    Will return the function evaluated at every point, with a single call if vectorized is True
+    and one call per point otherwise.
+    """
+    if vectorized:
+        return np.asarray(fcn(x), dtype=float) * np.ones(x.shape)
+    return np.array([fcn(x_single) for x_single in x], dtype=float)
+
+
+def scan_brackets(x: np.ndarray, y: np.ndarray) -> Union[list, list]:
+    """
+    Given grid points x and function values y.
+    Will return the brackets (x_i, x_i+1) where y changes sign, the brackets (x_i, x_i) where y is exactly zero,
+    and the candidate cells (x_i-1, x_i+1) where |y| has a local minimum without a sign change, or y is exactly zero
+    with the same sign on both sides, which may hide a pair of roots (or a second root) between grid points.
+    """
+    brackets = [(x_single, x_single) for x_single in x[y == 0]]
+    sign_change = ((y[:-1] < 0) & (y[1:] > 0)) | ((y[:-1] > 0) & (y[1:] < 0))
+    brackets += [(x[kk], x[kk + 1]) for kk in np.flatnonzero(sign_change)]
+    abs_y = np.abs(y)
+    same_sign = (np.sign(y[:-2]) == np.sign(y[1:-1])) & (np.sign(y[1:-1]) == np.sign(y[2:])) & (y[1:-1] != 0)
+    dip = same_sign & (abs_y[1:-1] < abs_y[:-2]) & (abs_y[1:-1] <= abs_y[2:])
+    # an exact zero whose neighbours do not change sign is a root of even multiplicity or has a second root nearby
+    dip |= (y[1:-1] == 0) & (np.sign(y[:-2]) == np.sign(y[2:])) & (y[:-2] != 0)
+    candidates = [(x[kk], x[kk + 2]) for kk in np.flatnonzero(dip)]
+    return brackets, candidates
+
+
+def find_brackets(fcn: Callable, a: float, b: float, num_grid: int = 1000, refine_depth: int = 4, refine_factor: int = 8, vectorized: bool = True) -> list:
+    """
+    Given a continuous function, bounds a and b, and the number of grid cells.
+    Will scan [a, b] on a uniform grid and return the sorted list of brackets (lo, hi) with a sign change
+    (or lo == hi where the function is exactly zero) that can be passed to the solvers.
+    Cells where |fcn| dips without a sign change are re-scanned on a grid refine_factor times finer,
+    up to refine_depth times, to find pairs of close roots that the coarse grid steps over.
+    """
+    check_a_less_b(a, b)
+    if num_grid < 1:
+        raise ValueError(f"Invalid number of grid cells: {num_grid}. Must be at least 1.")
+    x = np.linspace(a, b, num_grid + 1)
+    brackets, candidates = scan_brackets(x, evaluate_grid(fcn, x, vectorized))
+    for _ in range(0, refine_depth):
+        refined = []
+        for lo, hi in candidates:
+            x = np.linspace(lo, hi, 2 * refine_factor + 1)
+            found, more_candidates = scan_brackets(x, evaluate_grid(fcn, x, vectorized))
+            brackets += found
+            refined += more_candidates
+        candidates = refined
+    return sorted(set(brackets))
+
+
+def find_all_roots(fcn: Callable, a: float, b: float, num_grid: int = 1000, max_num_roots: int = None, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, refine_depth: int = 4, refine_factor: int = 8, vectorized: bool = True, method: str = "bisection") -> dict:
+    """
+    Given a continuous function, bounds a and b, the number of grid cells, and solver settings.
+    Will find brackets with `find_brackets` and solve every bracket, returning the roots in [a, b] in increasing order.
+    With vectorized=True all brackets are solved together with `run_bisection_batch`. Otherwise every bracket is
+    solved with `run_bisection_method` and the given method.
+    If max_num_roots is given, only the first max_num_roots brackets (from the left) are solved.
+    Will return a dictionary with "roots" (np.ndarray) and "brackets" (list of (lo, hi)).
+    """
+    brackets = find_brackets(fcn, a, b, num_grid, refine_depth, refine_factor, vectorized)
+    if max_num_roots is not None:
+        brackets = brackets[:max_num_roots]
+    lo = np.array([bracket[0] for bracket in brackets], dtype=float)
+    hi = np.array([bracket[1] for bracket in brackets], dtype=float)
+    roots = lo.copy()
+    open_bracket = lo < hi
+    if np.any(open_bracket):
+        if vectorized:
+            batch = run_bisection_batch(fcn, lo[open_bracket], hi[open_bracket], tol_input, tol_output, max_num_iter)
+            if np.any(batch["status"] == STATUS_MAX_ITER):
+                raise ValueError(f"Maximum number of iterations ({max_num_iter}) reached without convergence")
+            roots[open_bracket] = batch["solution"]
+        else:
+            roots[open_bracket] = [run_bisection_method(fcn, lo_single, hi_single, tol_input, tol_output, max_num_iter, method, history="none")["solution"] for lo_single, hi_single in zip(lo[open_bracket], hi[open_bracket])]
+    result = {"roots": roots,
+              "brackets": brackets}
+    return result
@@ -0,0 +1,210 @@
+from bisectionmethod import bisection_method as bim
+import argparse
+import importlib
+from itertools import islice
+import json
+import numpy as np
+from pathlib import Path
+import sys
+from typing import Callable, Iterator, Union
+
+
+STATUS_NOT_RUN = -1
+
+OUTPUT_DTYPE = np.dtype([("solution", "f8"), ("num_iter", "i8"), ("status", "i8")])
+
+
+def load_function(spec: str) -> Callable:
+    """
+    Given a function spec "module:function" (e.g. "numpy:sin").
+    Will import the module and return the function.
+    """
+    module_name, _, function_name = spec.partition(":")
+    if not module_name or not function_name:
+        raise ValueError(f"Invalid function: {spec}. Must be of the form module:function.")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def count_rows(input_path: Path, skiprows: int = 0) -> int:
+    """
+    Given a .npy or CSV file of brackets.
+    Will return the number of brackets without loading the file into memory.
+    """
+    input_path = Path(input_path)
+    if input_path.suffix == ".npy":
+        return np.load(input_path, mmap_mode="r").shape[0]
+    with open(input_path) as file:
+        return sum(1 for line in islice(file, skiprows, None) if line.strip())
+
+
+def check_columns(brackets: np.ndarray):
+    """
+    Given an array of brackets.
+    Will throw an error if it is not 2-D with at least 2 columns (a, b).
+    """
+    if brackets.ndim != 2 or brackets.shape[1] < 2:
+        raise ValueError(f"Invalid input: brackets must be rows with at least 2 columns (a, b), found shape {brackets.shape}.")
+    return True
+
+
+def iter_bracket_chunks(input_path: Path, chunk_size: int, start: int = 0, skiprows: int = 0) -> Iterator[Union[int, np.ndarray]]:
+    """
+    Given a .npy or CSV file with one bracket per row (columns a, b and optional parameters),
+    the number of rows per chunk, and the first row to read.
+    Will yield (offset, chunk) pairs, where chunk is a 2-D float array of at most chunk_size rows.
+    .npy files are memory-mapped and CSV files are read line by line, so only one chunk is in memory at a time.
+    """
+    input_path = Path(input_path)
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}. Must be at least 1.")
+    if input_path.suffix == ".npy":
+        brackets = np.load(input_path, mmap_mode="r")
+        check_columns(brackets)
+        for offset in range(start, brackets.shape[0], chunk_size):
+            yield offset, np.asarray(brackets[offset:offset + chunk_size], dtype=float)
+        return
+    with open(input_path) as file:
+        lines = (line for line in islice(file, skiprows, None) if line.strip())
+        offset = start
+        lines = islice(lines, start, None)
+        while True:
+            chunk_lines = list(islice(lines, chunk_size))
+            if len(chunk_lines) == 0:
+                return
+            chunk = np.loadtxt(chunk_lines, delimiter=",", ndmin=2)
+            check_columns(chunk)
+            yield offset, chunk
+            offset += len(chunk_lines)
+
+
+def run_info_path(output_path: Path) -> Path:
+    """
+    Given the path of the output .npy file. Will return the path of its JSON sidecar, e.g. roots.npy.json.
+    """
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name + ".json")
+
+
+def make_run_info(fcn: Callable, input_path: Path, skiprows: int, tol_input: float, tol_output: float, max_num_iter: int) -> dict:
+    """
+    Given the function, the input file and the solver arguments of a bulk solve.
+    Will return a JSON-serializable description of the run (input path, size and modification time, function and
+    arguments), which is stored next to the output so that only an output of the same run is resumed.
+    """
+    input_path = Path(input_path)
+    stat = input_path.stat()
+    function_name = getattr(fcn, "__qualname__", getattr(fcn, "__name__", type(fcn).__name__))
+    run_info = {"input": str(input_path.resolve()),
+                "input_size": stat.st_size,
+                "input_mtime_ns": stat.st_mtime_ns,
+                "skiprows": skiprows,
+                "function": f"{getattr(fcn, '__module__', None)}:{function_name}",
+                "tol_input": tol_input,
+                "tol_output": tol_output,
+                "max_num_iter": max_num_iter}
+    return run_info
+
+
+def open_output(output_path: Path, num_rows: int, run_info: dict = None, overwrite: bool = False) -> np.memmap:
+    """
+    Given the path of the output .npy file, the number of brackets, the run_info of this run (see `make_run_info`),
+    and whether an existing output may be replaced.
+    Will return a memory-mapped structured array with fields "solution", "num_iter" and "status".
+    An existing output is opened for resuming only if it has the same size and its sidecar (see `run_info_path`)
+    records the same run_info. Any other existing output is replaced if overwrite is True, and otherwise raises an
+    error instead of being reused. A new output has every status set to STATUS_NOT_RUN.
+    """
+    output_path = Path(output_path)
+    info_path = run_info_path(output_path)
+    if output_path.is_file() and not overwrite:
+        output = np.lib.format.open_memmap(output_path, mode="r+")
+        same_run = info_path.is_file() and json.loads(info_path.read_text()) == run_info
+        if output.dtype == OUTPUT_DTYPE and output.shape == (num_rows,) and same_run:
+            return output
+        del output
+        raise ValueError(f"Invalid output: {output_path} was not created by this run (input, function and arguments). Pass overwrite=True (--overwrite) to replace it.")
+    output = np.lib.format.open_memmap(output_path, mode="w+", dtype=OUTPUT_DTYPE, shape=(num_rows,))
+    output["solution"] = np.nan
+    output["num_iter"] = 0
+    output["status"] = STATUS_NOT_RUN
+    output.flush()
+    info_path.write_text(json.dumps(run_info))
+    return output
+
+
+def first_not_run(output: np.memmap, chunk_size: int) -> int:
+    """
+    Given an output array from `open_output` and the chunk size.
+    Will return the offset of the first chunk that has not been fully solved.
+    """
+    for offset in range(0, output.shape[0], chunk_size):
+        if np.any(output["status"][offset:offset + chunk_size] == STATUS_NOT_RUN):
+            return offset
+    return output.shape[0]
+
+
+def solve_bulk(fcn: Callable, input_path: Path, output_path: Path, chunk_size: int = 100000, start: int = None, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, skiprows: int = 0, verbose: bool = False, overwrite: bool = False) -> dict:
+    """
+    Given a vectorized continuous function, a .npy or CSV file of brackets (columns a, b and optional
+    parameters passed to fcn as fcn(x, *params)), and the path of the output .npy file.
+    Will stream the brackets in chunks, solve every chunk with `run_bisection_batch`, and write
+    "solution", "num_iter" and "status" into the memory-mapped output, so memory use does not grow with the input.
+    Solving starts at row start. If start is None, it resumes at the first chunk of an existing output
+    that was not solved, or at 0 for a new output. An existing output is only resumed if it was created for the same
+    input file, function and arguments, otherwise an error is raised unless overwrite is True (see `open_output`).
+    Will return a dictionary with "num_rows", "start", and "status_counts" (number of rows per status code).
+    """
+    num_rows = count_rows(input_path, skiprows)
+    run_info = make_run_info(fcn, input_path, skiprows, tol_input, tol_output, max_num_iter)
+    output = open_output(output_path, num_rows, run_info, overwrite)
+    if start is None:
+        start = first_not_run(output, chunk_size)
+    for offset, chunk in iter_bracket_chunks(input_path, chunk_size, start, skiprows):
+        result = bim.run_bisection_batch(fcn, chunk[:, 0], chunk[:, 1], tol_input, tol_output, max_num_iter, args=chunk[:, 2:].T)
+        rows = slice(offset, offset + chunk.shape[0])
+        output["solution"][rows] = result["solution"]
+        output["num_iter"][rows] = result["num_iter"]
+        output["status"][rows] = result["status"]
+        output.flush()
+        if verbose:
+            print(f"solved rows {offset} to {offset + chunk.shape[0]} of {num_rows}")
+    status_counts = {}
+    for offset in range(0, num_rows, chunk_size):
+        codes, counts = np.unique(output["status"][offset:offset + chunk_size], return_counts=True)
+        for code, count in zip(codes, counts):
+            status_counts[int(code)] = status_counts.get(int(code), 0) + int(count)
+    summary = {"num_rows": num_rows,
+               "start": start,
+               "status_counts": status_counts}
+    return summary
+
+
+def main(argv: list = None) -> int:
+    """
+    Console entry point `bisection-bulk`, see `bisection-bulk --help`.
+    Will return the exit code, 1 with the message on stderr if the function, input or output is invalid.
+    """
+    parser = argparse.ArgumentParser(description="Solve brackets from a .npy or CSV file in chunks with the vectorized bisection method.")
+    parser.add_argument("function", help="vectorized function as module:function, called as fcn(x, *params)")
+    parser.add_argument("input", type=Path, help=".npy or CSV file with columns a, b and optional parameters")
+    parser.add_argument("output", type=Path, help="output .npy file with fields solution, num_iter and status")
+    parser.add_argument("--chunk-size", type=int, default=100000)
+    parser.add_argument("--start", type=int, default=None, help="first row to solve (default: resume the output)")
+    parser.add_argument("--tol-input", type=float, default=10 ** -9)
+    parser.add_argument("--tol-output", type=float, default=10 ** -30)
+    parser.add_argument("--max-num-iter", type=int, default=1000)
+    parser.add_argument("--skiprows", type=int, default=0, help="number of CSV header lines")
+    parser.add_argument("--overwrite", action="store_true", help="replace an output that was created by another run instead of failing")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+    try:
+        summary = solve_bulk(load_function(args.function), args.input, args.output, args.chunk_size, args.start, args.tol_input, args.tol_output, args.max_num_iter, args.skiprows, args.verbose, args.overwrite)
+    except ValueError as error:
+        print(f"{parser.prog}: error: {error}", file=sys.stderr)
+        return 1
+    print(f"{summary['num_rows']} rows, status counts: {summary['status_counts']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
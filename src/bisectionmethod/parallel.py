@@ -0,0 +1,111 @@
+from bisectionmethod import bisection_method as bim
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import os
+from typing import Sequence
+
+
+STATUS_ERROR = 4
+
+RESULT_FIELDS = (("solution", np.float64), ("num_iter", np.int64), ("num_eval", np.int64), ("status", np.int64))
+
+# ValueError messages of the solver and the matching batch status codes
+ERROR_STATUS = (("Invalid input", bim.STATUS_INVALID_INTERVAL),
+                ("a and b are not guaranteed to contain a root", bim.STATUS_SIGN_INCOMPATIBLE),
+                ("The function evaluations must have one positive and one negative value", bim.STATUS_SIGN_INCOMPATIBLE),
+                ("Maximum number of iterations", bim.STATUS_MAX_ITER))
+
+
+def status_from_error(error: Exception) -> int:
+    """
+    Given an exception raised by a solve.
+    Will return the matching status code of `run_bisection_batch`, or STATUS_ERROR for any other exception.
+    """
+    if isinstance(error, ValueError):
+        for prefix, status in ERROR_STATUS:
+            if str(error).startswith(prefix):
+                return status
+    return STATUS_ERROR
+
+
+def attach_results(names: dict, num_problems: int) -> dict:
+    """
+    Given the names of the shared memory blocks and the number of problems.
+    Will return the attached SharedMemory blocks and NumPy arrays on top of them, keyed by field.
+    """
+    blocks = {field: shared_memory.SharedMemory(name=names[field]) for field, _ in RESULT_FIELDS}
+    arrays = {field: np.ndarray((num_problems,), dtype=dtype, buffer=blocks[field].buf) for field, dtype in RESULT_FIELDS}
+    return blocks, arrays
+
+
+def solve_chunk(names: dict, num_problems: int, start: int, problems: Sequence, tol_input: float, tol_output: float, max_num_iter: int, method: str) -> dict:
+    """
+    Given the names of the shared result arrays, the offset of a chunk, and its (fcn, a, b) problems.
+    Will solve every problem and write "solution", "num_iter", "num_eval" and "status" straight into the shared arrays.
+    Will return only the error messages of failed problems, keyed by problem index.
+    """
+    blocks, arrays = attach_results(names, num_problems)
+    errors = {}
+    try:
+        for index, (fcn, a, b) in enumerate(problems, start):
+            try:
+                if method == "bisection":
+                    result = bim.run_bisection_fast(fcn, a, b, tol_input, tol_output, max_num_iter)
+                else:
+                    result = bim.run_bisection_method(fcn, a, b, tol_input, tol_output, max_num_iter, method, history="none")
+            except Exception as error:
+                arrays["status"][index] = status_from_error(error)
+                errors[index] = f"{type(error).__name__}: {error}"
+                continue
+            arrays["solution"][index] = result["solution"]
+            arrays["num_iter"][index] = result["num_iter"]
+            arrays["num_eval"][index] = result["num_eval"]
+            arrays["status"][index] = bim.STATUS_CONVERGED
+    finally:
+        del arrays
+        for block in blocks.values():
+            block.close()
+    return errors
+
+
+def run_bisection_processes(problems: Sequence, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, method: str = "bisection", num_workers: int = None, chunk_size: int = None) -> dict:
+    """
+    Given a sequence of independent (fcn, a, b) problems (fcn must be picklable), tolerances, and a method.
+    Will split the problems into chunks of chunk_size and solve them on num_workers processes (default: all cores).
+    Workers write their results into multiprocessing.shared_memory arrays, so results are not pickled back.
+    Errors are reported per problem instead of stopping the batch: the ValueErrors of the solver map to the status
+    codes of `run_bisection_batch`, and any other exception has status STATUS_ERROR.
+    Will return a dictionary with arrays "solution" (NaN where not converged), "num_iter", "num_eval" and "status",
+    and "errors", a dictionary of error messages keyed by problem index.
+    """
+    bim.check_method(method)
+    num_problems = len(problems)
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers < 1:
+        raise ValueError(f"Invalid number of workers: {num_workers}. Must be at least 1.")
+    if chunk_size is None:
+        chunk_size = max(1, -(-num_problems // (4 * num_workers)))
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}. Must be at least 1.")
+    blocks = {field: shared_memory.SharedMemory(create=True, size=max(num_problems, 1) * np.dtype(dtype).itemsize) for field, dtype in RESULT_FIELDS}
+    names = {field: block.name for field, block in blocks.items()}
+    try:
+        arrays = {field: np.ndarray((num_problems,), dtype=dtype, buffer=blocks[field].buf) for field, dtype in RESULT_FIELDS}
+        arrays["solution"][:] = np.nan
+        arrays["num_iter"][:] = 0
+        arrays["num_eval"][:] = 0
+        errors = {}
+        with ProcessPoolExecutor(max_workers=num_workers) as pool:
+            futures = [pool.submit(solve_chunk, names, num_problems, start, problems[start:start + chunk_size], tol_input, tol_output, max_num_iter, method) for start in range(0, num_problems, chunk_size)]
+            for future in futures:
+                errors.update(future.result())
+        result = {field: array.copy() for field, array in arrays.items()}
+        result["errors"] = errors
+        del arrays
+    finally:
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+    return result
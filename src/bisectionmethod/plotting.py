@@ -0,0 +1,189 @@
+from bisectionmethod.bisection_method import EvaluationCache, evaluate_grid
+from matplotlib.figure import Figure
+import matplotlib.pyplot as plt
+import numpy as np
+from pathlib import Path
+from typing import Callable, Sequence
+
+
+def evaluate_curve(fcn: Callable, x: np.ndarray) -> np.ndarray:
+    """
+    Given a function and an array of points to draw.
+    Will evaluate fcn on the whole array with one call, and fall back to one call per point
+    if fcn does not accept arrays or does not return one value per point.
+    If fcn is an EvaluationCache, the cache is bypassed so drawing does not evict solver points.
+    """
+    if isinstance(fcn, EvaluationCache):
+        fcn = fcn.fcn
+    try:
+        y = np.asarray(fcn(x), dtype=float)
+    except (TypeError, ValueError):
+        return evaluate_grid(fcn, x, vectorized=False)
+    if y.shape == x.shape:
+        return y
+    if y.size == 1:
+        return np.full(x.shape, y.item())
+    return evaluate_grid(fcn, x, vectorized=False)
+
+
+def downsample_indices(num_points: int, max_points: int = None) -> np.ndarray:
+    """
+    Given the number of points in a history and the maximum number of points to draw.
+    Will return at most max_points evenly spaced indices, always including the first and last point.
+    """
+    if max_points is None or num_points <= max_points:
+        return np.arange(0, num_points)
+    return np.unique(np.linspace(0, num_points - 1, max(max_points, 2)).round().astype(int))
+
+
+def draw_bisection_results(axs: Sequence, result: dict, max_points: int = None):
+    """
+    Given two matplotlib axes and a result with a stored history.
+    Will draw the convergence of a, b and the midpoints on axs[0] and the interval size on axs[1],
+    using at most max_points points of the history.
+    """
+    a_values = np.asarray(result["all_a"], dtype=float)
+    b_values = np.asarray(result["all_b"], dtype=float)
+    num_iter = result["num_iter"]
+    final_root = result["solution"]
+
+    # Iteration numbers of the stored history (only the last iterations are stored with history="last_k")
+    iterations = np.arange(num_iter + 1 - len(a_values), num_iter + 1)
+    keep = downsample_indices(len(a_values), max_points)
+    iterations = iterations[keep]
+    a_values = a_values[keep]
+    b_values = b_values[keep]
+
+    # Compute midpoint values and interval sizes for visualization
+    midpoints = (a_values + b_values) / 2.0
+    interval_sizes = b_values - a_values
+
+    # Plot a and b values over iterations
+    axs[0].plot(iterations, a_values, marker="o", color="red", label="a values", linestyle="--")
+    axs[0].plot(iterations, b_values, marker="s", color="blue", label="b values", linestyle="--")
+    axs[0].plot(iterations, midpoints, marker=".", color="cyan", label="Midpoints", linestyle="-")
+    axs[0].scatter([num_iter], [final_root], color="yellow", label="Root: %0.6f" % (final_root), s=200, edgecolors="black")
+    axs[0].set_xlabel("Iteration")
+    axs[0].set_ylabel("Value")
+    axs[0].set_title("Convergence of a, b, and Midpoints")
+    axs[0].legend()
+    axs[0].grid(True)
+
+    # Plot interval sizes over iterations
+    axs[1].plot(iterations, interval_sizes, marker="o", color="black", linestyle="-")
+    axs[1].set_yscale("log")
+    axs[1].set_xlabel("Iteration")
+    axs[1].set_ylabel("Interval Size (log scale)")
+    axs[1].set_title("Convergence of Interval Size")
+    axs[1].grid(True)
+    return
+
+
+def plot_bisection_results(result: dict, fig_name_with_path: Path, max_points: int = None):
+    """
+    Plots the results of the bisection method.
+    
+    Parameters:
+        result (dict): Output from the `run_bisection_method` function (with a stored history), containing:
+            - "all_a": List of all intermediate a values
+            - "all_b": List of all intermediate b values
+            - "num_iter": Number of iterations
+        max_points (int): (Optional) Maximum number of iterations to draw, long histories are downsampled.
+
+    The figure is closed after it is saved.
+    """
+    fig, axs = plt.subplots(1, 2, figsize=(9, 4))
+    draw_bisection_results(axs, result, max_points)
+    plt.tight_layout()
+    plt.savefig(fig_name_with_path)
+    plt.close(fig)
+    return
+
+
+def plot_bisection_report(results: Sequence, fig_names_with_path: Sequence, max_points: int = 200):
+    """
+    Plots the results of many solves, one file per result, like `plot_bisection_results`.
+    A single non-interactive figure (not registered with pyplot) is reused for every result,
+    and histories longer than max_points iterations are downsampled.
+
+    Parameters:
+        results (list): Outputs from `run_bisection_method` with a stored history.
+        fig_names_with_path (list): One output path per result.
+        max_points (int): Maximum number of iterations to draw per result.
+    """
+    if len(results) != len(fig_names_with_path):
+        raise ValueError(f"Invalid input: {len(results)} results and {len(fig_names_with_path)} file names.")
+    fig = Figure(figsize=(9, 4))
+    axs = fig.subplots(1, 2)
+    for result, fig_name_with_path in zip(results, fig_names_with_path):
+        for ax in axs:
+            ax.cla()
+        draw_bisection_results(axs, result, max_points)
+        fig.tight_layout()
+        fig.savefig(fig_name_with_path)
+    return
+
+
+def plot_function_with_inset(fcn, result: dict, fig_name_with_path: Path, max_points: int = None):
+    """
+    Plots the original function and visualizes the evolution of `a` and `b` 
+    with an inset plot zoomed in around the root.
+
+    Parameters:
+        fcn (callable): The function being solved using the bisection method.
+        result (dict): Output dictionary from `run_bisection_method` containing:
+            - "solution": The computed root.
+            - "all_a", "all_b": The `a` and `b` values from the iterations.
+            - "all_fcn_a", "all_fcn_b": (Optional) The function values at `a` and `b`, reused instead of calling fcn.
+        max_points (int): (Optional) Maximum number of `a` and `b` values to draw, long histories are downsampled.
+
+    The curve is evaluated with `evaluate_curve`. The figure is closed after it is saved.
+    """
+    # Extract the root and define a range around it for better visualization
+    root = result["solution"]
+    keep = downsample_indices(len(result["all_a"]), max_points)
+    a_values = np.asarray(result["all_a"], dtype=float)[keep]
+    b_values = np.asarray(result["all_b"], dtype=float)[keep]
+    if "all_fcn_a" in result and result["all_fcn_a"] is not None:
+        fcn_a_values = np.asarray(result["all_fcn_a"], dtype=float)[keep]
+    else:
+        fcn_a_values = [fcn(a) for a in a_values]
+    if "all_fcn_b" in result and result["all_fcn_b"] is not None:
+        fcn_b_values = np.asarray(result["all_fcn_b"], dtype=float)[keep]
+    else:
+        fcn_b_values = [fcn(b) for b in b_values]
+    fcn_root = fcn(root)
+    x_range = np.linspace(min(a_values) - 1, max(b_values) + 1, 1000)
+    y_values = evaluate_curve(fcn, x_range)
+    
+    # Main plot: Original function
+    fig = plt.figure(figsize=(6, 4))
+    plt.plot(x_range, y_values, label="f(x)", color="black")
+    plt.axhline(0, color="black", linestyle="--", linewidth=0.8)  # Horizontal line at y=0
+    plt.scatter(a_values, fcn_a_values, marker="o", color="red", label="a values", zorder=5)
+    plt.scatter(b_values, fcn_b_values, marker="s", color="blue", label="b values", zorder=5)
+    plt.scatter([root], [fcn_root], color="yellow", label="Root", zorder=10, s=100, edgecolors="black")
+    plt.xlabel("x")
+    plt.ylabel("f(x)")
+    plt.title("Function Plot with Iterations of a and b")
+    plt.legend()
+    plt.grid(True)
+    
+    # Inset plot: Zoomed-in view around the root
+    ax_inset = plt.gca().inset_axes([0.6, 0.6, 0.3, 0.3])  # Define inset position and size
+    zoom_range = np.linspace(root - 0.5, root + 0.5, 500)
+    zoom_y_values = evaluate_curve(fcn, zoom_range)
+    ax_inset.plot(zoom_range, zoom_y_values, color="black")
+    ax_inset.scatter(a_values, fcn_a_values, marker="o", color="red", s=10)
+    ax_inset.scatter(b_values, fcn_b_values, marker="s", color="blue", s=10)
+    ax_inset.scatter([root], [fcn_root], color="yellow", s=50, edgecolors="black")
+    ax_inset.axhline(0, color="black", linestyle="--", linewidth=0.8)
+    ax_inset.set_xlim(root - 0.1, root + 0.1)
+    ax_inset.set_ylim(-0.1, 0.1)
+    ax_inset.set_title("Zoomed-in View of Root")
+    ax_inset.grid(True)
+    
+    plt.tight_layout()
+    plt.savefig(fig_name_with_path)
+    plt.close(fig)
+    return
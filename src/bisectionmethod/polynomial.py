@@ -0,0 +1,311 @@
+from bisectionmethod import bisection_method as bim
+import numpy as np
+
+
+def horner(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Given polynomial coefficients of shape (..., degree + 1), highest power first (like numpy.polyval),
+    and points x that broadcast against coefficients.shape[:-1].
+    Will evaluate every polynomial with Horner's scheme, one vectorized multiply-add per degree.
+    For example, coefficients of shape (n, degree + 1) and x of shape (n,) evaluate polynomial i at x[i].
+    """
+    coefficients = np.asarray(coefficients, dtype=float)
+    x = np.asarray(x, dtype=float)
+    values = np.broadcast_to(coefficients[..., 0], np.broadcast_shapes(coefficients.shape[:-1], x.shape)).copy()
+    for k in range(1, coefficients.shape[-1]):
+        values *= x
+        values += coefficients[..., k]
+    return values
+
+
+def check_coefficients(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Given coefficients of one polynomial (1-D) or of many polynomials (2-D, one per row).
+    Will return them as a 2-D float array, or throw an error if they are not finite or a polynomial is zero.
+    """
+    coefficients = np.asarray(coefficients, dtype=float)
+    if coefficients.ndim not in (1, 2) or coefficients.shape[-1] == 0:
+        raise ValueError(f"Invalid polynomial: coefficients must be a 1-D or 2-D array, found shape {coefficients.shape}.")
+    coefficients = np.atleast_2d(coefficients)
+    if not np.all(np.isfinite(coefficients)):
+        raise ValueError("Invalid polynomial: coefficients must be finite.")
+    if np.any(np.all(coefficients == 0, axis=1)):
+        raise ValueError("Invalid polynomial: the zero polynomial has no isolated roots.")
+    return coefficients
+
+
+def degrees(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Given coefficients of shape (num_poly, num_coef), highest power first.
+    Will return the degree of every polynomial, skipping leading zeros, and -1 for the zero polynomial.
+    """
+    nonzero = coefficients != 0
+    return np.where(np.any(nonzero, axis=1), coefficients.shape[1] - 1 - np.argmax(nonzero, axis=1), -1)
+
+
+def normalize(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Given coefficients of shape (num_poly, num_coef).
+    Will return every nonzero polynomial scaled to a maximum absolute coefficient of 1, which keeps its signs.
+    """
+    scale = np.max(np.abs(coefficients), axis=1, keepdims=True)
+    return coefficients / np.where(scale > 0, scale, 1)
+
+
+def default_rtol(num_coef: int) -> float:
+    """
+    Given the number of coefficients.
+    Will return the default rounding cutoff of the Sturm remainders, num_coef * 10 ** -13 relative to the dividend,
+    which grows with the rounding error of the coefficients of higher degree polynomials.
+    """
+    return num_coef * 10 ** -13
+
+
+def poly_divide(dividend: np.ndarray, divisor: np.ndarray, rtol: float = None) -> tuple:
+    """
+    Given coefficients of shape (num_poly, num_coef) of normalized dividends and divisors, highest power first.
+    Will return the quotients and remainders of all polynomial long divisions at once, one vectorized step per quotient term.
+    A remainder whose largest coefficient is at most rtol (default `default_rtol`) times the largest coefficient of
+    the dividend is rounding noise and set to zero, otherwise all its coefficients are kept, also small ones.
+    The division by the zero polynomial gives zeros.
+    """
+    if rtol is None:
+        rtol = default_rtol(dividend.shape[1])
+    remainder = dividend.copy()
+    quotient = np.zeros_like(remainder)
+    rows = np.arange(remainder.shape[0])
+    num_coef = remainder.shape[1]
+    degree_divisor = degrees(divisor)
+    leading_divisor = divisor[rows, num_coef - 1 - np.maximum(degree_divisor, 0)]
+    columns = np.arange(num_coef)
+    for _ in range(num_coef):
+        degree = degrees(remainder)
+        active = (degree_divisor >= 0) & (degree >= degree_divisor)
+        if not np.any(active):
+            break
+        shift = np.where(active, degree - degree_divisor, 0)
+        factor = np.where(active, remainder[rows, num_coef - 1 - np.maximum(degree, 0)] / np.where(active, leading_divisor, 1), 0)
+        quotient[rows[active], num_coef - 1 - shift[active]] += factor[active]
+        # divisor multiplied by x ** shift, aligned with the leading term of the remainder
+        shifted_columns = columns + shift[:, None]
+        shifted = np.where(shifted_columns < num_coef, np.take_along_axis(divisor, np.minimum(shifted_columns, num_coef - 1), axis=1), 0)
+        remainder -= factor[:, None] * shifted
+        remainder[rows[active], num_coef - 1 - degree[active]] = 0
+    # the remainder is zero if it is rounding noise relative to the dividend, small coefficients are kept otherwise
+    negligible = np.max(np.abs(remainder), axis=1) <= rtol * np.max(np.abs(dividend), axis=1)
+    remainder[negligible | (degree_divisor < 0)] = 0
+    return quotient, remainder
+
+
+def sturm_table(coefficients: np.ndarray, rtol: float = None) -> np.ndarray:
+    """
+    Given coefficients of shape (num_poly, degree + 1), highest power first.
+    Will return the Sturm sequences p, p', -rem(p, p'), ... of all polynomials as one zero-padded array of shape
+    (num_poly, degree + 1, degree + 1), every element normalized. All sequences are built together with
+    `poly_divide`, and a sequence ends (with zeros) at the first remainder that rounds to zero.
+    The last nonzero element is then gcd(p, p'), see `last_element`.
+    """
+    num_poly, num_coef = coefficients.shape
+    table = np.zeros((num_poly, num_coef, num_coef))
+    table[:, 0] = normalize(coefficients)
+    if num_coef > 1:
+        table[:, 1, 1:] = normalize(table[:, 0, :-1] * np.arange(num_coef - 1, 0, -1))
+    for k in range(2, num_coef):
+        table[:, k] = normalize(-poly_divide(table[:, k - 2], table[:, k - 1], rtol)[1])
+    return table
+
+
+def last_element(table: np.ndarray) -> np.ndarray:
+    """
+    Given Sturm sequences from `sturm_table`.
+    Will return the last nonzero element of every sequence, which is gcd(p, p') up to a constant factor.
+    """
+    length = np.sum(np.any(table != 0, axis=2), axis=1)
+    return table[np.arange(table.shape[0]), np.maximum(length - 1, 0)].copy()
+
+
+def square_free_part(table: np.ndarray, rtol: float = None) -> np.ndarray:
+    """
+    Given Sturm sequences from `sturm_table`.
+    Will return the normalized square-free parts p / gcd(p, p'), which have every distinct root of p as a simple root.
+    Unlike p, they change sign at roots of even multiplicity, and their Sturm sequences never vanish at a root.
+    """
+    return normalize(poly_divide(table[:, 0], last_element(table), rtol)[0])
+
+
+def gcd_chain(coefficients: np.ndarray, rtol: float = None) -> list:
+    """
+    Given coefficients of shape (num_poly, degree + 1).
+    Will return the Sturm tables of the square-free parts of p, g = gcd(p, p'), gcd(g, g'), ... for all polynomials
+    together, until every gcd is a constant. A root of multiplicity m is a root of the first m polynomials of the chain,
+    so summing the root counts over the chain counts roots with multiplicity (see `count_roots`).
+    """
+    tables = []
+    while True:
+        table = sturm_table(coefficients, rtol)
+        tables.append(sturm_table(square_free_part(table, rtol), rtol))
+        coefficients = last_element(table)
+        multiple = degrees(coefficients) >= 1
+        if not np.any(multiple):
+            return tables
+        # polynomials without multiple roots continue with the constant 1, which has no roots
+        coefficients[~multiple] = 0
+        coefficients[~multiple, -1] = 1
+
+
+def count_roots(tables: list, poly_index: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """
+    Given the Sturm tables of `gcd_chain`, and brackets (lo, hi] of the polynomials poly_index.
+    Will return the number of roots in every bracket, counted with multiplicity.
+    """
+    count = np.zeros(len(poly_index), dtype=int)
+    for table in tables:
+        count += sign_changes(horner(table[poly_index], lo[:, None])) - sign_changes(horner(table[poly_index], hi[:, None]))
+    return count
+
+
+def sign_changes(values: np.ndarray) -> np.ndarray:
+    """
+    Given Sturm sequence values of shape (n, length).
+    Will return the number of sign changes of every row, ignoring zeros.
+    """
+    changes = np.zeros(values.shape[0], dtype=int)
+    last_sign = np.sign(values[:, 0])
+    for k in range(1, values.shape[1]):
+        sign = np.sign(values[:, k])
+        changes += (sign * last_sign < 0)
+        last_sign = np.where(sign != 0, sign, last_sign)
+    return changes
+
+
+def root_bound(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Given coefficients of shape (num_poly, degree + 1).
+    Will return the Cauchy bound 1 + max|c_k / c_0| of every polynomial, all real roots are in (-bound, bound).
+    Leading zero coefficients (lower degree rows) are skipped.
+    """
+    leading = np.argmax(coefficients != 0, axis=1)
+    rows = np.arange(coefficients.shape[0])
+    ratios = np.abs(coefficients / coefficients[rows, leading][:, None])
+    ratios[np.arange(coefficients.shape[1]) <= leading[:, None]] = 0
+    return 1 + np.max(ratios, axis=1)
+
+
+def bracket_tol(lo: np.ndarray, hi: np.ndarray, tol_input: float) -> np.ndarray:
+    """
+    Given brackets (lo, hi] and the input tolerance.
+    Will return tol_input, raised to twice the float spacing at the brackets where that is wider, so that a bracket
+    of adjacent floats always counts as converged (also for roots of large magnitude).
+    """
+    return np.maximum(tol_input, 2 * np.spacing(np.maximum(np.abs(lo), np.abs(hi))))
+
+
+def check_root_counts(coefficients: np.ndarray, poly_index: np.ndarray, num_roots: np.ndarray, rtol: float = None):
+    """
+    Given coefficients of shape (num_poly, degree + 1), and the brackets and root counts of `isolate_real_roots`.
+    Will throw an error if the real roots of a polynomial, counted with multiplicity, are more than its degree or
+    differ from it by an odd number (complex roots come in pairs). The Sturm sequences are then not reliable at rtol.
+    """
+    total = np.bincount(poly_index, weights=num_roots, minlength=coefficients.shape[0]).astype(int)
+    degree = degrees(coefficients)
+    invalid = (total > degree) | ((degree - total) % 2 != 0)
+    if np.any(invalid):
+        index = np.flatnonzero(invalid)[0]
+        if rtol is None:
+            rtol = default_rtol(coefficients.shape[1])
+        raise ValueError(f"Invalid root count: {total[index]} real roots for polynomial {index} of degree {degree[index]}, its Sturm sequences are not reliable at rtol = {rtol}. Pass a smaller rtol.")
+    return True
+
+
+def isolate_square_free(coefficients: np.ndarray, tol_input: float = 10 ** -9, rtol: float = None) -> tuple:
+    """
+    Given coefficients of shape (num_poly, degree + 1), see `isolate_real_roots`.
+    Will return the brackets of `isolate_real_roots` and the square-free parts that were isolated.
+    """
+    tables = gcd_chain(coefficients, rtol)
+    table = tables[0]
+    square_free = table[:, 0]
+    bound = root_bound(coefficients)
+    poly_index = np.arange(coefficients.shape[0])
+    lo = -bound
+    hi = bound.copy()
+    changes_lo = sign_changes(horner(table, lo[:, None]))
+    changes_hi = sign_changes(horner(table, hi[:, None]))
+    done_index, done_lo, done_hi = [], [], []
+    while len(poly_index) > 0:
+        count = changes_lo - changes_hi
+        keep = count > 0
+        poly_index, lo, hi, changes_lo, changes_hi, count = poly_index[keep], lo[keep], hi[keep], changes_lo[keep], changes_hi[keep], count[keep]
+        # a root at lo belongs to the bracket on the left, so it is split off first
+        done = ((count == 1) & (horner(square_free[poly_index], lo) != 0)) | (hi - lo < bracket_tol(lo, hi, tol_input))
+        done_index.append(poly_index[done])
+        done_lo.append(lo[done])
+        done_hi.append(hi[done])
+        poly_index, lo, hi, changes_lo, changes_hi = poly_index[~done], lo[~done], hi[~done], changes_lo[~done], changes_hi[~done]
+        mid = (lo + hi) / 2
+        changes_mid = sign_changes(horner(table[poly_index], mid[:, None]))
+        poly_index = np.concatenate((poly_index, poly_index))
+        lo, hi = np.concatenate((lo, mid)), np.concatenate((mid, hi))
+        changes_lo, changes_hi = np.concatenate((changes_lo, changes_mid)), np.concatenate((changes_mid, changes_hi))
+    order = np.lexsort((np.concatenate(done_lo), np.concatenate(done_index)))
+    poly_index = np.concatenate(done_index)[order]
+    lo = np.concatenate(done_lo)[order]
+    hi = np.concatenate(done_hi)[order]
+    num_roots = count_roots(tables, poly_index, lo, hi)
+    check_root_counts(coefficients, poly_index, num_roots, rtol)
+    brackets = {"poly_index": poly_index,
+                "lo": lo,
+                "hi": hi,
+                "num_roots": num_roots}
+    return brackets, square_free
+
+
+def isolate_real_roots(coefficients: np.ndarray, tol_input: float = 10 ** -9, rtol: float = None) -> dict:
+    """
+    Given coefficients of one polynomial (1-D) or many polynomials (2-D, one per row), highest power first.
+    Will isolate every distinct real root in a bracket (lo, hi] that contains exactly one root, by counting the roots
+    of the square-free part p / gcd(p, p') with Sturm sequences and splitting brackets with more than one root at their
+    midpoint. All brackets of all polynomials are split together, so every round is one vectorized `horner` evaluation.
+    rtol (default `default_rtol`) is the rounding cutoff of the Sturm remainders, below which a remainder counts as zero.
+    It sets the resolution: distinct roots closer than roughly sqrt(rtol) times their size can be merged into one
+    multiple root, and clusters that stay unresolved at width `bracket_tol` are returned as one bracket.
+    Will return a dictionary with arrays "poly_index", "lo", "hi" and "num_roots", the number of roots of p in the
+    bracket counted with multiplicity (see `gcd_chain`), which is more than 1 for multiple roots and merged clusters.
+    Will throw an error if the root counts do not fit the degree, see `check_root_counts`.
+    """
+    return isolate_square_free(check_coefficients(coefficients), tol_input, rtol)[0]
+
+
+def find_polynomial_roots(coefficients: np.ndarray, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, rtol: float = None) -> dict:
+    """
+    Given coefficients of one polynomial (1-D) or many polynomials (2-D, one per row), highest power first.
+    Will isolate every distinct real root with `isolate_real_roots` and solve all brackets of all polynomials
+    together with `run_bisection_batch` on the square-free parts, which change sign at every root, also of even
+    multiplicity. The polynomials are evaluated with `horner` (no Python callback per point). tol_input is raised to
+    twice the float spacing at brackets where it is finer than that (see `bracket_tol`), so large roots converge.
+    Will return a dictionary with "roots", "brackets" (arrays of shape (num_roots, 2)) and "num_roots" (the
+    multiplicity of every root, or the size of a cluster merged below the resolution of rtol) in increasing order,
+    or for 2-D coefficients, lists with one such array per polynomial.
+    Will throw an error if a root does not converge within max_num_iter iterations.
+    """
+    coefficients_2d = check_coefficients(coefficients)
+    isolated, square_free = isolate_square_free(coefficients_2d, tol_input, rtol)
+    poly_index, lo, hi = isolated["poly_index"], isolated["lo"], isolated["hi"]
+    roots = (lo + hi) / 2
+    values_hi = horner(square_free[poly_index], hi)
+    roots[values_hi == 0] = hi[values_hi == 0]
+    solve = horner(square_free[poly_index], lo) * values_hi < 0
+    result = bim.run_bisection_batch(lambda x, index: horner(square_free[index], x), lo[solve], hi[solve], bracket_tol(lo[solve], hi[solve], tol_input), tol_output, max_num_iter, args=(poly_index[solve],))
+    if np.any(result["status"] == bim.STATUS_MAX_ITER):
+        raise ValueError(f"Maximum number of iterations ({max_num_iter}) reached without convergence")
+    if np.any(result["status"] != bim.STATUS_CONVERGED):
+        raise ValueError("The function evaluations must have one positive and one negative value, the polynomial lost its sign change while solving.")
+    roots[solve] = result["solution"]
+    brackets = np.column_stack((lo, hi))
+    split = np.searchsorted(poly_index, np.arange(1, coefficients_2d.shape[0]))
+    all_roots = np.split(roots, split)
+    all_brackets = np.split(brackets, split)
+    all_num_roots = np.split(isolated["num_roots"], split)
+    if np.ndim(coefficients) == 1:
+        return {"roots": all_roots[0], "brackets": all_brackets[0], "num_roots": all_num_roots[0]}
+    return {"roots": all_roots, "brackets": all_brackets, "num_roots": all_num_roots}
@@ -0,0 +1,133 @@
+from bisectionmethod import bisection_method as bim
+import numpy as np
+from typing import Callable, Sequence
+
+
+def warm_bracket(fcn: Callable, center: float, half_width: float, a: float, b: float, growth: float = 2.0, tol_input: float = None) -> tuple:
+    """
+    Given a continuous function, a guess of the root, a half width, and the cold bracket [a, b].
+    Will return the bracket (a, b, fcn_a, fcn_b) around center, clipped to [a, b], after multiplying the
+    half width by growth for as long as `check_sign_compatible` fails, the number of calls to fcn and of expansions,
+    and whether it fell back to the cold bracket. An endpoint that is clipped to a or b is evaluated only once.
+    With a positive tol_input, the expansion stops at the cold bracket [a, b] as soon as the next bracket could not
+    beat a cold solve even if it contained the root: its evaluations so far plus `bisection_iter_bound` of the next
+    bracket would reach the bound of [a, b] plus its 2 endpoint evaluations.
+    Will throw the error of `check_sign_compatible` if even [a, b] does not contain a root.
+    """
+    cold_cost = bim.bisection_iter_bound(a, b, tol_input) + 2 if tol_input is not None and tol_input > 0 else None
+    num_eval = 0
+    num_expand = 0
+    fallback = False
+    lower = upper = None
+    while True:
+        new_lower = max(a, center - half_width)
+        new_upper = min(b, center + half_width)
+        if cold_cost is not None and not fallback:
+            new_eval = (new_lower != lower) + (new_upper != upper)
+            if num_eval + new_eval + bim.bisection_iter_bound(new_lower, new_upper, tol_input) >= cold_cost:
+                fallback = True
+                new_lower, new_upper = a, b
+        if new_lower != lower:
+            lower = new_lower
+            fcn_lower = fcn(lower)
+            num_eval += 1
+        if new_upper != upper:
+            upper = new_upper
+            fcn_upper = fcn(upper)
+            num_eval += 1
+        try:
+            bim.check_sign_compatible(lower, upper, fcn_lower, fcn_upper)
+            return lower, upper, fcn_lower, fcn_upper, num_eval, num_expand, fallback
+        except ValueError:
+            if lower <= a and upper >= b:
+                raise
+        half_width *= growth
+        num_expand += 1
+
+
+def run_warm_bisection(fcn: Callable, center: float, half_width: float, a: float, b: float, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, method: str = "bisection", growth: float = 2.0) -> tuple:
+    """
+    Given a continuous function, a guess of the root with a half width, the bracket [a, b] that contains the root,
+    and the arguments of `run_bisection_method`.
+    Will solve from the `warm_bracket` around center, without evaluating its endpoints again.
+    Will return the last BisectionStep, the number of calls to fcn (including the warm bracket), the number of
+    expansions, and whether the warm bracket fell back to the cold bracket [a, b].
+    """
+    lower, upper, fcn_lower, fcn_upper, num_eval, num_expand, fallback = warm_bracket(fcn, center, half_width, a, b, growth, tol_input)
+    step = bim.BisectionStep(lower, upper, fcn_lower, fcn_upper, 0, 0)
+    for step in bim.iter_bisection(fcn, tol_input=tol_input, tol_output=tol_output, max_num_iter=max_num_iter, method=method, state=step.state()):
+        pass
+    return step, step.num_eval + num_eval, num_expand, fallback
+
+
+def check_growth(growth: float):
+    """
+    Given the growth factor of the warm bracket.
+    Will throw an error if it does not expand the bracket.
+    """
+    if growth <= 1:
+        raise ValueError(f"Invalid growth: {growth}. Must be greater than 1.")
+    return True
+
+
+def run_bisection_sweep(fcn: Callable, params: Sequence, a: float, b: float, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, method: str = "bisection", initial_width: float = None, growth: float = 2.0, compare_cold: bool = False) -> dict:
+    """
+    Given a continuous function fcn(x, p), a sequence of slowly varying parameters, the cold bracket [a, b], and the
+    arguments of `run_bisection_method`.
+    Will solve fcn(x, p) = 0 for every p in order (continuation). The first parameter is solved on [a, b], and every
+    next solve is warm-started from a bracket around the previous root, of width twice the last change of the root
+    (initial_width, default (b - a) / 1024, for the second parameter). The warm bracket is expanded by growth until
+    `check_sign_compatible` passes, and never leaves [a, b]. It falls back to [a, b] once the expansion could no
+    longer beat a cold solve (see `warm_bracket`).
+    With compare_cold=True, cold iterations are those of an actual cold solve of every parameter on [a, b] (which
+    doubles the cost). Otherwise they are the bisection bound `bisection_iter_bound(a, b, tol_input)` for
+    method="bisection" with a positive tol_input, and unknown (None) for the other methods, which have no such bound.
+    Will return a dictionary with the arrays "params", "solution", "num_iter", "num_eval" (including the evaluations
+    of the warm bracket), "num_expand", "cold_fallback" (True where the warm bracket fell back to [a, b]) and
+    "num_iter_cold", and "iterations_saved", the total of
+    num_iter_cold - num_iter (None if the cold iterations are unknown).
+    """
+    bim.check_method(method)
+    bim.check_a_less_b(a, b)
+    check_growth(growth)
+    if initial_width is None:
+        initial_width = (b - a) / 1024
+    if initial_width <= 0:
+        raise ValueError(f"Invalid initial width: {initial_width}. Must be positive.")
+    params = list(params)
+    num_params = len(params)
+    solution = np.full(num_params, np.nan)
+    num_iter = np.zeros(num_params, dtype=int)
+    num_eval = np.zeros(num_params, dtype=int)
+    num_expand = np.zeros(num_params, dtype=int)
+    cold_fallback = np.zeros(num_params, dtype=bool)
+    if compare_cold:
+        num_iter_cold = np.zeros(num_params, dtype=int)
+    elif method == "bisection" and tol_input > 0:
+        num_iter_cold = np.full(num_params, bim.bisection_iter_bound(a, b, tol_input), dtype=int)
+    else:
+        num_iter_cold = None
+    width = initial_width
+    for index, p in enumerate(params):
+        fcn_p = lambda x: fcn(x, p)
+        if index == 0:
+            for step in bim.iter_bisection(fcn_p, a, b, tol_input, tol_output, max_num_iter, method):
+                pass
+            num_eval[index] = step.num_eval
+        else:
+            step, num_eval[index], num_expand[index], cold_fallback[index] = run_warm_bisection(fcn_p, solution[index - 1], max(width, tol_input) / 2, a, b, tol_input, tol_output, max_num_iter, method, growth)
+        solution[index] = bim.midpoint(step.a, step.b)
+        num_iter[index] = step.iteration
+        if index > 0:
+            width = 2 * abs(solution[index] - solution[index - 1])
+        if compare_cold:
+            num_iter_cold[index] = bim.run_bisection_method(fcn_p, a, b, tol_input, tol_output, max_num_iter, method, history="none")["num_iter"]
+    result = {"params": np.asarray(params),
+              "solution": solution,
+              "num_iter": num_iter,
+              "num_eval": num_eval,
+              "num_expand": num_expand,
+              "cold_fallback": cold_fallback,
+              "num_iter_cold": num_iter_cold,
+              "iterations_saved": None if num_iter_cold is None else int(np.sum(num_iter_cold) - np.sum(num_iter))}
+    return result
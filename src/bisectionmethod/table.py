@@ -0,0 +1,148 @@
+from bisectionmethod import bisection_method as bim
+from bisectionmethod import sweep
+import numpy as np
+from pathlib import Path
+from typing import Callable, Union
+
+
+def solve_params(fcn: Callable, params: np.ndarray, a: float, b: float, tol_input: float, tol_output: float, max_num_iter: int, vectorized: bool = True) -> np.ndarray:
+    """
+    Given a continuous function fcn(x, p), an array of parameters, the bracket [a, b], and the solver arguments.
+    Will return the root of fcn(x, p) = 0 for every p, solved with `run_bisection_batch` if fcn accepts arrays
+    and with `run_bisection_method` otherwise.
+    Will throw an error if [a, b] does not contain a root for one of the parameters.
+    """
+    if vectorized:
+        result = bim.run_bisection_batch(fcn, np.full(params.shape, a), np.full(params.shape, b), tol_input, tol_output, max_num_iter, args=(params,))
+        failed = result["status"] != bim.STATUS_CONVERGED
+        if np.any(failed):
+            raise ValueError(f"Invalid input: no root found in [{a}, {b}] for p = {params[failed][0]} (status {result['status'][failed][0]}).")
+        return result["solution"]
+    return np.array([bim.run_bisection_method(lambda x: fcn(x, p), a, b, tol_input, tol_output, max_num_iter, history="none")["solution"] for p in params])
+
+
+class RootTable:
+    """
+    Roots of fcn(x, p) = 0 on a sorted grid of parameters, with a per-cell error estimate of the linear interpolation.
+    A uniform bucket index over the grid makes `lookup` O(1), also on an adaptively refined grid.
+    """
+    __slots__ = ("params", "roots", "errors", "a", "b", "buckets", "bucket_width")
+
+    def __init__(self, params: np.ndarray, roots: np.ndarray, errors: np.ndarray, a: float, b: float):
+        self.params = np.asarray(params, dtype=float)
+        self.roots = np.asarray(roots, dtype=float)
+        self.errors = np.asarray(errors, dtype=float)
+        self.a = float(a)
+        self.b = float(b)
+        if self.params.ndim != 1 or len(self.params) < 2 or np.any(np.diff(self.params) <= 0):
+            raise ValueError("Invalid input: params must be at least 2 increasing values.")
+        if self.roots.shape != self.params.shape or self.errors.shape != (len(self.params) - 1,):
+            raise ValueError(f"Invalid input: {len(self.params)} params need as many roots and one error per cell.")
+        # first cell of every bucket, a bucket is never wider than the narrowest cell
+        num_buckets = int(np.ceil((self.params[-1] - self.params[0]) / np.min(np.diff(self.params))))
+        self.bucket_width = (self.params[-1] - self.params[0]) / num_buckets
+        edges = self.params[0] + self.bucket_width * np.arange(num_buckets + 1)
+        self.buckets = np.clip(np.searchsorted(self.params, edges, side="right") - 1, 0, len(self.params) - 2)
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def cell(self, p: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Given one or many parameters within the table.
+        Will return the index of the cell [params[i], params[i + 1]] that contains each parameter.
+        """
+        p = np.asarray(p, dtype=float)
+        if np.any(p < self.params[0]) or np.any(p > self.params[-1]):
+            raise ValueError(f"Invalid input: p must be within the table [{self.params[0]}, {self.params[-1]}].")
+        bucket = np.minimum(((p - self.params[0]) / self.bucket_width).astype(int), len(self.buckets) - 1)
+        index = self.buckets[bucket]
+        # a bucket overlaps at most two cells, the second check covers rounding at the bucket edges
+        index = np.where((index < len(self.params) - 2) & (p > self.params[index + 1]), index + 1, index)
+        index = np.where((index > 0) & (p < self.params[index]), index - 1, index)
+        return index
+
+    def lookup(self, p: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Given one or many parameters within the table.
+        Will return the linearly interpolated roots in O(1) per parameter, without calling fcn.
+        """
+        index = self.cell(p)
+        p_left = self.params[index]
+        weight = (np.asarray(p, dtype=float) - p_left) / (self.params[index + 1] - p_left)
+        roots = self.roots[index] + weight * (self.roots[index + 1] - self.roots[index])
+        if np.ndim(p) == 0:
+            return float(roots)
+        return roots
+
+    def lookup_polished(self, fcn: Callable, p: float, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, method: str = "bisection") -> dict:
+        """
+        Given the continuous function fcn(x, p) of the table, one parameter within the table, and the solver arguments.
+        Will polish the interpolated root by solving from a tight bracket around it, twice the error estimate of its cell
+        wide, which is expanded while it does not contain a root (see `sweep.warm_bracket`). The result is as accurate
+        as a cold solve on [a, b], usually after a few iterations.
+        Will return a dictionary with "solution", "num_iter", "num_eval", "num_expand" and "cold_fallback".
+        """
+        guess = self.lookup(p)
+        half_width = max(2 * self.errors[int(self.cell(p))], tol_input)
+        step, num_eval, num_expand, cold_fallback = sweep.run_warm_bisection(lambda x: fcn(x, p), guess, half_width, self.a, self.b, tol_input, tol_output, max_num_iter, method)
+        result = {"solution": bim.midpoint(step.a, step.b),
+                  "num_iter": step.iteration,
+                  "num_eval": num_eval,
+                  "num_expand": num_expand,
+                  "cold_fallback": cold_fallback}
+        return result
+
+    def save(self, path: Path):
+        """
+        Given a file path. Will save the table as a .npz file that `load_root_table` reads.
+        """
+        np.savez(path, params=self.params, roots=self.roots, errors=self.errors, bracket=np.array([self.a, self.b]))
+        return
+
+
+def load_root_table(path: Path) -> RootTable:
+    """
+    Given the path of a table saved with `RootTable.save`. Will return the RootTable.
+    """
+    with np.load(Path(path)) as data:
+        return RootTable(data["params"], data["roots"], data["errors"], *data["bracket"])
+
+
+def build_root_table(fcn: Callable, p_min: float, p_max: float, a: float, b: float, num_grid: int = 64, tol_table: float = 10 ** -6, max_depth: int = 10, tol_input: float = 10 ** -9, tol_output: float = 10 ** -30, max_num_iter: int = 1000, vectorized: bool = True) -> RootTable:
+    """
+    Given a continuous function fcn(x, p) with one root in [a, b] for every p in [p_min, p_max], the number of grid cells,
+    and the interpolation tolerance.
+    Will solve the roots on a uniform grid of num_grid cells and split every cell at its midpoint. Halves of a cell
+    whose linear interpolation missed the root at the midpoint by more than tol_table are split again, up to
+    max_depth more times. All midpoints of one level are solved together (with `run_bisection_batch` if vectorized,
+    fcn must then accept arrays).
+    The error estimate of each cell is the interpolation error measured at the midpoint of its parent cell.
+    Will return the RootTable.
+    """
+    bim.check_a_less_b(a, b)
+    bim.check_a_less_b(p_min, p_max)
+    if num_grid < 1:
+        raise ValueError(f"Invalid number of grid cells: {num_grid}. Must be at least 1.")
+    params = np.linspace(p_min, p_max, num_grid + 1)
+    roots = solve_params(fcn, params, a, b, tol_input, tol_output, max_num_iter, vectorized)
+    errors = np.full(num_grid, np.inf)
+    refine = np.ones(num_grid, dtype=bool)
+    for depth in range(max_depth + 1):
+        cells = np.flatnonzero(refine)
+        if len(cells) == 0:
+            break
+        mid_params = (params[cells] + params[cells + 1]) / 2
+        mid_roots = solve_params(fcn, mid_params, a, b, tol_input, tol_output, max_num_iter, vectorized)
+        mid_errors = np.abs(mid_roots - (roots[cells] + roots[cells + 1]) / 2)
+        # both halves of a split cell inherit the error measured at its midpoint
+        params = np.insert(params, cells + 1, mid_params)
+        roots = np.insert(roots, cells + 1, mid_roots)
+        errors[cells] = mid_errors
+        errors = np.insert(errors, cells + 1, mid_errors)
+        refine = np.insert(refine, cells + 1, False)
+        split = np.zeros(len(errors), dtype=bool)
+        split[cells + np.arange(len(cells))] = True
+        split[cells + np.arange(len(cells)) + 1] = True
+        refine = split & (errors > tol_table) & (depth < max_depth)
+    return RootTable(params, roots, errors, a, b)
@@ -1,8 +1,13 @@
+import asyncio
 from bisectionmethod import bisection_method as bim
+import json
 import numpy as np
 from pathlib import Path
 import pytest
 import re
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 
 def test_hello_world():
@@ -223,3 +228,616 @@ def test_plot_bisection_results():
     fig_name_with_path = data_path.joinpath("test_plot_bisection_results.png").resolve()
     bim.plot_bisection_results(result, fig_name_with_path)
     assert fig_name_with_path.is_file()
+
+
+def test_root_found_batch():
+    a = np.array([1.0, 1.0, 1.0, 0.0])
+    b = np.array([1.0 + 1e-10, 2.0, 2.0, 0.0])
+    fcn_a = np.array([-0.5, 1e-10, -0.5, 0.0])
+    fcn_b = np.array([0.5, 1e-10, 0.5, 0.0])
+    found = bim.root_found_batch(a, b, fcn_a, fcn_b, tol_input=1e-9, tol_output=1e-9)
+    known = [bim.root_found(a[kk], b[kk], fcn_a[kk], fcn_b[kk], 1e-9, 1e-9) for kk in range(0, 4)]
+    assert np.array_equal(found, known)
+
+
+def test_update_a_b_batch():
+    cases = [(1.0, 2.0, 1.5, -0.5, 0.5, -0.2),
+             (1.0, 2.0, 1.5, -0.5, 0.5, 0.2),
+             (1.0, 2.0, 1.5, 0.0, 0.5, -0.2),
+             (1.0, 2.0, 1.5, -0.5, 0.0, 0.2),
+             (1.0, 2.0, 1.5, -0.5, 0.5, 0.0)]
+    arrays = [np.array(col) for col in zip(*cases)]
+    new_a, new_b, new_fcn_a, new_fcn_b, invalid = bim.update_a_b_batch(*arrays)
+    for kk, case in enumerate(cases):
+        known = bim.update_a_b(*case)
+        assert (new_a[kk], new_b[kk], new_fcn_a[kk], new_fcn_b[kk]) == known
+    assert not np.any(invalid)
+    # evaluations with the same sign or an undefined sign are flagged per lane
+    _, _, _, _, invalid = bim.update_a_b_batch(np.array([1.0, 1.0, 1.0]), np.array([2.0, 2.0, 2.0]), np.array([1.5, 1.5, 1.5]), np.array([0.5, -0.5, -0.5]), np.array([0.5, 0.5, 0.5]), np.array([0.2, np.nan, 0.2]))
+    assert np.array_equal(invalid, [True, True, False])
+
+
+def test_run_bisection_batch():
+    rng = np.random.default_rng(0)
+    a = rng.uniform(-1.0, 1.4, 50)
+    b = rng.uniform(1.5, 10.0, 50)
+    result = bim.run_bisection_batch(fcn, a, b, 10 ** -10, 10 ** -20)
+    assert np.all(result["status"] == bim.STATUS_CONVERGED)
+    for kk in range(0, a.size):
+        known = bim.run_bisection_method(fcn, a[kk], b[kk], 10 ** -10, 10 ** -20)
+        assert result["solution"][kk] == known["solution"]
+        assert result["num_iter"][kk] == known["num_iter"]
+    # exact roots hit at a midpoint retire early
+    result = bim.run_bisection_batch(fcn_3, np.array([-1.0, -3.0]), np.array([1.0, 1.0]))
+    assert np.array_equal(result["solution"], [0.0, 0.0])
+    assert np.array_equal(result["num_iter"], [1, 2])
+    # invalid lanes are reported instead of raised
+    a = np.array([10.0, 5.0, -1.0, 0.0])
+    b = np.array([-3.0, 10.0, 1.0, 20.0])
+    result = bim.run_bisection_batch(fcn_3, a, b)
+    assert np.array_equal(result["status"], [bim.STATUS_INVALID_INTERVAL, bim.STATUS_SIGN_INCOMPATIBLE, bim.STATUS_CONVERGED, bim.STATUS_SIGN_INCOMPATIBLE])
+    assert np.isnan(result["solution"][0])
+    assert result["solution"][2] == 0.0
+    result = bim.run_bisection_batch(fcn_2, np.array([0.0, 0.0]), np.array([20.0, 30.0]), 10 ** -10, 10 ** -30, 10)
+    assert np.array_equal(result["status"], [bim.STATUS_MAX_ITER, bim.STATUS_MAX_ITER])
+    assert np.all(np.isnan(result["solution"]))
+    # broadcasting keeps the input shape
+    result = bim.run_bisection_batch(fcn, 0.0, np.full((2, 3), 10.0))
+    assert result["solution"].shape == (2, 3)
+    assert np.allclose(result["solution"], np.sqrt(2))
+    # per-lane tolerances
+    result = bim.run_bisection_batch(fcn, np.zeros(2), np.full(2, 10.0), np.array([10 ** -2, 10 ** -10]), 10 ** -30)
+    for kk, tol_input in enumerate([10 ** -2, 10 ** -10]):
+        assert result["num_iter"][kk] == bim.run_bisection_method(fcn, 0.0, 10.0, tol_input, 10 ** -30)["num_iter"]
+
+
+def test_check_method():
+    for method in bim.METHODS:
+        assert bim.check_method(method) is True
+    with pytest.raises(ValueError, match="Invalid method: newton. Must be one of bisection, illinois, brent, itp, multisection."):
+        bim.check_method("newton")
+
+
+def test_make_update_step():
+    assert bim.make_update_step("bisection", 1.0, 2.0, fcn(1.0), fcn(2.0), 10 ** -9) is bim.update_step
+    for method in ["illinois", "brent", "itp"]:
+        step = bim.make_update_step(method, 1.0, 2.0, fcn(1.0), fcn(2.0), 10 ** -9)
+        a, b, fcn_a, fcn_b = step(fcn, 1.0, 2.0, fcn(1.0), fcn(2.0))
+        # the new bracket is inside the old one and still contains the root
+        assert 1.0 <= a < np.sqrt(2) < b <= 2.0
+        assert fcn_a == fcn(a)
+        assert fcn_b == fcn(b)
+
+
+def test_run_bisection_method_methods():
+    bisection = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20)
+    assert bisection["num_eval"] == bisection["num_iter"] + 2
+    for method in ["illinois", "brent", "itp"]:
+        result = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20, method=method)
+        assert np.isclose(result["solution"], np.sqrt(2))
+        assert result["num_eval"] < bisection["num_eval"]
+        assert len(result["all_a"]) == result["num_iter"] + 1
+        assert len(result["all_fcn_b"]) == result["num_iter"] + 1
+        # the bracket is guaranteed at every iteration
+        for a, b, fcn_a, fcn_b in zip(result["all_a"], result["all_b"], result["all_fcn_a"], result["all_fcn_b"]):
+            assert a <= np.sqrt(2) <= b
+            assert np.sign(fcn_a) != np.sign(fcn_b) or a == b
+        result = bim.run_bisection_method(fcn_2, 0.0, 20.0, 10 ** -10, 10 ** -30, method=method)
+        assert np.isclose(result["solution"], 10.75, 10 ** -9)
+        result = bim.run_bisection_method(fcn_3, -1.0, 3.0, method=method)
+        assert np.isclose(result["solution"], 0.0)
+        with pytest.raises(ValueError, match="a and b are not guaranteed to contain a root of the continous function provided"):
+            bim.run_bisection_method(fcn_3, 5.0, 10.0, method=method)
+    with pytest.raises(ValueError, match="Invalid method"):
+        bim.run_bisection_method(fcn, 0.0, 10.0, method="newton")
+
+
+@pytest.mark.parametrize("method", bim.METHODS)
+def test_run_bisection_method_zero_tol_input(method):
+    # only tol_output or an exact root can stop the solve
+    result = bim.run_bisection_method(lambda x: x - 1, -1.0, 3.0, 0.0, 10 ** -12, method=method)
+    assert result["solution"] == 1.0
+    result = bim.run_bisection_method(fcn, -1.0, 3.0, 0.0, 10 ** -12, method=method)
+    assert abs(result["solution"] - np.sqrt(2)) < 10 ** -12
+
+
+def test_check_history():
+    for history in bim.HISTORY_MODES:
+        assert bim.check_history(history) is True
+    with pytest.raises(ValueError, match="Invalid history: all. Must be one of list, none, array, last_k."):
+        bim.check_history("all")
+
+
+def test_bisection_iter_bound():
+    assert bim.bisection_iter_bound(0.0, 1.0, 2.0) == 0
+    assert bim.bisection_iter_bound(0.0, 1.0, 0.5) == 2
+    assert bim.bisection_iter_bound(0.0, 1.0, 0.3) == 2
+    result = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -30)
+    assert result["num_iter"] <= bim.bisection_iter_bound(0.0, 10.0, 10 ** -10)
+    with pytest.raises(ValueError, match="Invalid input: tol_input must be positive to bound the iterations, found 0.0."):
+        bim.bisection_iter_bound(0.0, 1.0, 0.0)
+
+
+@pytest.mark.parametrize("history", bim.HISTORY_MODES)
+def test_run_bisection_method_zero_tol_input_history(history):
+    result = bim.run_bisection_method(lambda x: x, -1.0, 3.0, 0.0, 10 ** -12, history=history)
+    assert result["solution"] == 0.0
+    assert result["num_iter"] == 2
+    result = bim.run_bisection_method(fcn, 0.0, 2.0, 0.0, 10 ** -12, max_num_iter=100, history=history)
+    assert abs(result["solution"] - np.sqrt(2)) < 10 ** -12
+    if history in ("list", "array"):
+        assert len(result["all_a"]) == result["num_iter"] + 1
+
+
+def test_history_objects():
+    values = [(1.0, 2.0, -1.0, 2.0), (1.0, 1.5, -1.0, 0.25), (1.25, 1.5, -0.4375, 0.25)]
+    for trace in [bim.ListHistory(), bim.ArrayHistory(1), bim.RingHistory(3)]:
+        for a, b, fcn_a, fcn_b in values:
+            trace.append(a, b, fcn_a, fcn_b)
+        all_a, all_fcn_a, all_b, all_fcn_b = trace.values()
+        assert list(all_a) == [1.0, 1.0, 1.25]
+        assert list(all_fcn_a) == [-1.0, -1.0, -0.4375]
+        assert list(all_b) == [2.0, 1.5, 1.5]
+        assert list(all_fcn_b) == [2.0, 0.25, 0.25]
+    trace = bim.RingHistory(2)
+    for a, b, fcn_a, fcn_b in values:
+        trace.append(a, b, fcn_a, fcn_b)
+    assert list(trace.values()[0]) == [1.0, 1.25]
+    trace = bim.NoHistory()
+    trace.append(*values[0])
+    assert trace.values() == (None, None, None, None)
+    with pytest.raises(ValueError, match="Invalid history size: 0. Must be at least 1."):
+        bim.RingHistory(0)
+
+
+def test_bisection_result():
+    result = bim.BisectionResult(1.5, 3, 5)
+    assert result["solution"] == result.solution == 1.5
+    assert "num_eval" in result
+    assert "foo" not in result
+    assert result["all_a"] is None
+    with pytest.raises(KeyError):
+        result["foo"]
+    assert list(result.to_dict().keys()) == list(result.keys())
+    assert "num_iter=3" in repr(result)
+    with pytest.raises(AttributeError):
+        result.foo = 1
+
+
+def test_run_bisection_method_history(tmp_path):
+    known = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20)
+    for history in ["none", "array", "last_k"]:
+        result = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20, history=history, history_size=5)
+        assert result["solution"] == known["solution"]
+        assert result["num_iter"] == known["num_iter"]
+    result = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20, history="none")
+    assert result["all_a"] is None
+    result = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20, history="array")
+    assert isinstance(result["all_a"], np.ndarray)
+    assert np.array_equal(result["all_a"], known["all_a"])
+    assert np.array_equal(result["all_fcn_b"], known["all_fcn_b"])
+    # non-bisection methods may need more entries than the bisection bound
+    result = bim.run_bisection_method(fcn_2, 0.0, 20.0, 10 ** -10, 10 ** -30, method="brent", history="array")
+    assert len(result["all_a"]) == result["num_iter"] + 1
+    result = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20, history="last_k", history_size=5)
+    assert np.array_equal(result["all_b"], known["all_b"][-5:])
+    fig_name_with_path = tmp_path.joinpath("last_k.png")
+    bim.plot_bisection_results(result, fig_name_with_path)
+    assert fig_name_with_path.is_file()
+    with pytest.raises(ValueError, match="Invalid history"):
+        bim.run_bisection_method(fcn, 0.0, 10.0, history="all")
+
+
+def test_run_bisection_fast():
+    rng = np.random.default_rng(1)
+    for a, b in zip(rng.uniform(-1.0, 1.4, 20), rng.uniform(1.5, 10.0, 20)):
+        known = bim.run_bisection_method(fcn, a, b, 10 ** -10, 10 ** -20)
+        found = bim.run_bisection_fast(fcn, a, b, 10 ** -10, 10 ** -20)
+        assert found["solution"] == known["solution"]
+        assert found["num_iter"] == known["num_iter"]
+        assert found["num_eval"] == known["num_eval"]
+        assert found["all_a"] is None
+        found = bim.run_bisection_fast(fcn, a, b, 10 ** -10, 10 ** -20, validate=False)
+        assert found["solution"] == known["solution"]
+    # decreasing function and exact roots
+    known = bim.run_bisection_method(lambda x: 2.0 - x ** 2, 0.0, 10.0)
+    found = bim.run_bisection_fast(lambda x: 2.0 - x ** 2, 0.0, 10.0)
+    assert found["solution"] == known["solution"]
+    found = bim.run_bisection_fast(fcn_3, -3.0, 1.0)
+    assert found["solution"] == 0.0
+    assert found["num_iter"] == 2
+    # examples that give errors
+    with pytest.raises(ValueError, match="a and b are not guaranteed to contain a root of the continous function provided"):
+        bim.run_bisection_fast(fcn_3, 5.0, 10.0)
+    with pytest.raises(ValueError, match=r"Invalid input: 10 is greater than -3\."):
+        bim.run_bisection_fast(fcn_3, 10, -3)
+    with pytest.raises(ValueError, match=re.escape("Maximum number of iterations (10) reached without convergence")):
+        bim.run_bisection_fast(fcn_2, 0.0, 20.0, 10 ** -10, 10 ** -30, 10)
+    with pytest.raises(ValueError, match="The function evaluations must have one positive and one negative value."):
+        bim.run_bisection_fast(lambda x: np.nan if x == 0.5 else x - 0.75, 0.0, 1.0)
+
+
+def test_evaluation_cache():
+    calls = []
+
+    def counted(x):
+        calls.append(x)
+        return x ** 2 - 2
+
+    cached = bim.EvaluationCache(counted, maxsize=2)
+    assert cached(1.0) == -1.0
+    assert cached(np.float64(1.0)) == -1.0
+    assert cached(2.0) == 2.0
+    assert cached.cache_info() == {"hits": 1, "misses": 2, "size": 2, "maxsize": 2}
+    # 2.0 is the least recently used entry once 1.0 is used again, so it is evicted
+    cached(1.0)
+    cached(3.0)
+    assert len(cached) == 2
+    assert 2.0 not in cached.values
+    assert calls == [1.0, 2.0, 3.0]
+    cached.cache_clear()
+    assert cached.cache_info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+    with pytest.raises(ValueError, match="Invalid cache size: 0. Must be at least 1."):
+        bim.EvaluationCache(counted, maxsize=0)
+
+
+def test_evaluation_cache_solver_and_plot(tmp_path):
+    calls = []
+
+    def counted(x):
+        calls.append(x)
+        return x ** 2 - 2
+
+    cached = bim.EvaluationCache(counted)
+    known = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20)
+    result = bim.run_bisection_method(cached, 0.0, 10.0, 10 ** -10, 10 ** -20)
+    assert result["solution"] == known["solution"]
+    assert len(calls) == result["num_eval"]
+    # a second solve on an overlapping bracket reuses the shared endpoint
+    bim.run_bisection_method(cached, 0.0, 5.0, 10 ** -10, 10 ** -20)
+    assert cached.cache_info()["hits"] >= 1
+    assert len(set(calls)) == len(calls)
+    # plotting only evaluates the root and the two grids (one vectorized call each), never the stored a and b values
+    num_calls = len(calls)
+    bim.plot_function_with_inset(cached, result, tmp_path.joinpath("cached.png"))
+    assert len(calls) - num_calls == 1 + 1 + 1
+    assert [np.size(x) for x in calls[num_calls:]] == [1, 1000, 500]
+
+
+def fcn_module_level(x):
+    return x ** 2 - 2
+
+
+def test_make_executor():
+    pool, owns_pool = bim.make_executor(None, 2)
+    assert isinstance(pool, ThreadPoolExecutor) and owns_pool
+    pool.shutdown()
+    pool, owns_pool = bim.make_executor("process", 2)
+    assert isinstance(pool, ProcessPoolExecutor) and owns_pool
+    pool.shutdown()
+    with ThreadPoolExecutor(max_workers=2) as user_pool:
+        pool, owns_pool = bim.make_executor(user_pool, 2)
+        assert pool is user_pool and not owns_pool
+    with pytest.raises(ValueError, match="Invalid executor: gpu."):
+        bim.make_executor("gpu", 2)
+
+
+def test_make_multisection_step():
+    with pytest.raises(ValueError, match="Invalid number of sections: 1. Must be at least 2."):
+        bim.make_multisection_step(None, 1)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        step = bim.make_multisection_step(pool, 4)
+        assert step(fcn, 0.0, 4.0, fcn(0.0), fcn(4.0)) == (1.0, 2.0, fcn(1.0), fcn(2.0))
+        # exact roots at an interior point collapse the bracket
+        assert step(fcn_3, -1.0, 3.0, -1.0, 3.0) == (0.0, 0.0, 0.0, 0.0)
+        with pytest.raises(ValueError, match="The function evaluations must have one positive and one negative value."):
+            step(lambda x: np.nan, 0.0, 4.0, -1.0, 1.0)
+
+
+def test_run_bisection_method_multisection():
+    bisection = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20)
+    result = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20, method="multisection", num_sections=8)
+    assert np.isclose(result["solution"], np.sqrt(2))
+    # 8 sections shrink the bracket by 2 ** 3 per round
+    assert result["num_iter"] == int(np.ceil(bisection["num_iter"] / 3))
+    assert result["num_eval"] == 2 + 7 * result["num_iter"]
+    assert len(result["all_a"]) == result["num_iter"] + 1
+    result = bim.run_bisection_method(fcn_module_level, 0.0, 10.0, 10 ** -10, 10 ** -20, method="multisection", executor="process")
+    assert np.isclose(result["solution"], np.sqrt(2))
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        result = bim.run_bisection_method(fcn_2, 0.0, 20.0, 10 ** -10, 10 ** -30, method="multisection", num_sections=3, executor=pool)
+        assert np.isclose(result["solution"], 10.75, 10 ** -9)
+        # a user supplied executor is left running
+        assert pool.submit(fcn, 2.0).result() == 2.0
+    with pytest.raises(ValueError, match="Invalid number of sections: 1. Must be at least 2."):
+        bim.run_bisection_method(fcn, 0.0, 10.0, method="multisection", num_sections=1)
+
+
+async def fcn_async(x):
+    await asyncio.sleep(0)
+    return x ** 2 - 2
+
+
+def test_run_bisection_method_async():
+    known = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20)
+    found = asyncio.run(bim.run_bisection_method_async(fcn_async, 0.0, 10.0, 10 ** -10, 10 ** -20))
+    assert found["solution"] == known["solution"]
+    assert found["num_iter"] == known["num_iter"]
+    assert found["num_eval"] == known["num_eval"]
+    assert found["all_a"] == known["all_a"]
+    with pytest.raises(ValueError, match="a and b are not guaranteed to contain a root of the continous function provided"):
+        asyncio.run(bim.run_bisection_method_async(fcn_async, 5.0, 10.0))
+    with pytest.raises(ValueError, match=re.escape("Maximum number of iterations (10) reached without convergence")):
+        asyncio.run(bim.run_bisection_method_async(fcn_async, 0.0, 20.0, 10 ** -10, 10 ** -30, 10))
+
+
+def test_run_bisection_batch_async():
+    in_flight = [0, 0]
+
+    async def fcn_tracked(x):
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[0], in_flight[1])
+        await asyncio.sleep(0)
+        in_flight[0] -= 1
+        return x ** 2 - 2
+
+    a = [0.0, 1.0, 5.0, 10.0] * 5
+    b = [10.0, 2.0, 10.0, 0.0] * 5
+    found = asyncio.run(bim.run_bisection_batch_async(fcn_tracked, a, b, 10 ** -10, 10 ** -20, max_concurrency=3))
+    assert len(found) == 20
+    assert in_flight[1] == 3
+    for kk in range(0, 20):
+        if a[kk] >= b[kk]:
+            assert isinstance(found[kk], ValueError)
+            assert "is greater than" in str(found[kk])
+        elif a[kk] == 5.0:
+            assert isinstance(found[kk], ValueError)
+            assert "not guaranteed to contain a root" in str(found[kk])
+        else:
+            known = bim.run_bisection_method(fcn, a[kk], b[kk], 10 ** -10, 10 ** -20)
+            assert found[kk]["solution"] == known["solution"]
+            assert found[kk]["all_a"] is None
+    with pytest.raises(ValueError, match="Invalid max_concurrency: 0. Must be at least 1."):
+        asyncio.run(bim.run_bisection_batch_async(fcn_async, a, b, max_concurrency=0))
+
+
+def test_scan_brackets():
+    x = np.array([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    y = np.array([-1.0, 1.0, 0.5, 0.75, 0.0, 1.0, 2.0])
+    brackets, candidates = bim.scan_brackets(x, y)
+    assert brackets == [(4.0, 4.0), (0.0, 1.0)]
+    assert candidates == [(1.0, 3.0), (3.0, 5.0)]
+
+
+def test_evaluate_grid():
+    x = np.linspace(0.0, 1.0, 5)
+    assert np.array_equal(bim.evaluate_grid(fcn, x), x ** 2 - 2)
+    assert np.array_equal(bim.evaluate_grid(fcn, x, vectorized=False), x ** 2 - 2)
+    assert np.array_equal(bim.evaluate_grid(lambda x: 1.0, x), np.ones(5))
+
+
+def test_find_brackets():
+    brackets = bim.find_brackets(np.sin, 1.0, 10.0, 100)
+    assert len(brackets) == 3
+    for lo, hi in brackets:
+        assert np.sin(lo) * np.sin(hi) < 0
+    # two roots closer than the grid spacing are found by refining where |fcn| dips
+    def close_roots(x):
+        return (x - 1.03) * (x - 1.0301) * (x + 3.0)
+    assert len(bim.find_brackets(close_roots, -5.0, 5.0, 100, refine_depth=0)) == 1
+    assert len(bim.find_brackets(close_roots, -5.0, 5.0, 100)) == 3
+    # a root exactly on a grid point can hide a second root next to it
+    assert np.allclose(bim.find_all_roots(lambda x: (x - 1.0) * (x - 1.0001) * (x + 3.0), -10.0, 10.0)["roots"], [-3.0, 1.0, 1.0001])
+    assert np.allclose(bim.find_all_roots(lambda x: (x - 0.5) * (x - 0.5001), 0.0, 1.0, num_grid=10)["roots"], [0.5, 0.5001])
+    assert np.allclose(bim.find_all_roots(lambda x: (x - 0.5) ** 2, 0.0, 1.0, num_grid=10)["roots"], [0.5])
+    with pytest.raises(ValueError, match="Invalid number of grid cells: 0. Must be at least 1."):
+        bim.find_brackets(np.sin, 1.0, 10.0, 0)
+    with pytest.raises(ValueError, match=r"Invalid input: 10.0 is greater than 1.0\."):
+        bim.find_brackets(np.sin, 10.0, 1.0)
+
+
+def test_find_all_roots():
+    result = bim.find_all_roots(np.sin, -1.0, 20.0, tol_input=10 ** -12)
+    known = np.pi * np.arange(0, 7)
+    assert np.allclose(result["roots"], known, atol=10 ** -11)
+    assert len(result["brackets"]) == 7
+    result = bim.find_all_roots(np.cos, 0.0, 20.0, vectorized=False, method="brent")
+    assert np.allclose(result["roots"], np.pi / 2 + np.pi * np.arange(0, 6))
+    result = bim.find_all_roots(np.sin, -1.0, 20.0, max_num_roots=2)
+    assert np.allclose(result["roots"], [0.0, np.pi])
+    result = bim.find_all_roots(fcn, 2.0, 3.0)
+    assert result["roots"].size == 0
+    with pytest.raises(ValueError, match=re.escape("Maximum number of iterations (3) reached without convergence")):
+        bim.find_all_roots(np.sin, 1.0, 4.0, 10, max_num_iter=3)
+
+
+def test_float_to_ordered_int():
+    values = [-np.inf, -1e300, -2.5, -5e-324, 0.0, 5e-324, 1.0, np.nextafter(1.0, 2.0), 1e300, np.inf]
+    keys = [bim.float_to_ordered_int(value) for value in values]
+    assert keys == sorted(keys)
+    assert bim.float_to_ordered_int(-0.0) == bim.float_to_ordered_int(0.0) == 0
+    assert keys[7] - keys[6] == 1
+    assert keys[5] - keys[3] == 2
+    for value, key in zip(values, keys):
+        assert bim.ordered_int_to_float(key) == value
+
+
+def test_float_bits_iter_bound():
+    assert bim.float_bits_iter_bound(1.0, np.nextafter(1.0, 2.0)) == 0
+    assert bim.float_bits_iter_bound(1.0, 2.0) == 52
+    assert bim.float_bits_iter_bound(-1e308, 1e308) <= 64
+    # the tolerance caps the bound, within one binade like the bisection method
+    assert bim.float_bits_iter_bound(1.0, 2.0, 10 ** -3) == bim.bisection_iter_bound(1.0, 2.0, 10 ** -3)
+    assert bim.float_bits_iter_bound(1.0, 2.0, 10 ** -20) == bim.float_bits_iter_bound(1.0, 2.0, 0.0) == 52
+    for a, b, tol_input in [(1.0, 2.0, 10 ** -6), (0.0, 10.0, 10 ** -9), (-3.0, 1000.0, 10 ** -4), (-1e300, 1e300, 10 ** -300)]:
+        result = bim.run_bisection_float_bits(lambda x: x - 1.7, a, b, tol_input, 0.0)
+        assert result["num_iter"] <= bim.float_bits_iter_bound(a, b, tol_input) <= bim.float_bits_iter_bound(a, b)
+
+
+def test_run_bisection_float_bits():
+    # tol_input below the float spacing near the root stops at adjacent floats within the bound
+    with pytest.raises(ValueError, match=re.escape("Maximum number of iterations (1000) reached without convergence")):
+        bim.run_bisection_method(fcn, 1.0, 2.0, 10 ** -20, 0.0)
+    result = bim.run_bisection_float_bits(fcn, 1.0, 2.0, 10 ** -20, 0.0)
+    assert result["num_iter"] <= bim.float_bits_iter_bound(1.0, 2.0)
+    assert np.nextafter(result["all_a"][-1], 2.0) == result["all_b"][-1]
+    assert result["all_a"][-1] <= np.sqrt(2) <= result["all_b"][-1]
+    result = bim.run_bisection_float_bits(fcn_3, -1e300, 1e300, 10 ** -300, 0.0)
+    assert result["num_iter"] <= 64
+    assert abs(result["solution"]) < 10 ** -300
+    # within one binade the bracket is split like the bisection method
+    known = bim.run_bisection_method(fcn, 1.0, 2.0, 10 ** -10, 10 ** -30)
+    result = bim.run_bisection_float_bits(fcn, 1.0, 2.0, 10 ** -10, 10 ** -30)
+    assert result["all_a"] == known["all_a"]
+    assert result["solution"] == known["solution"]
+    # zero tolerances stop at adjacent floats, the "array" history is sized from the bound
+    for history in bim.HISTORY_MODES:
+        result = bim.run_bisection_float_bits(fcn, 1.0, 2.0, 0.0, 0.0, history=history)
+        assert result["num_iter"] <= 52
+    assert len(result["all_a"]) == 10
+    result = bim.run_bisection_float_bits(fcn, 1.0, 2.0, 0.0, 0.0, history="array")
+    assert len(result["all_a"]) == result["num_iter"] + 1
+    assert np.nextafter(result["all_a"][-1], 2.0) == result["all_b"][-1]
+    # examples that give errors
+    with pytest.raises(ValueError, match="must be finite"):
+        bim.run_bisection_float_bits(fcn_3, -np.inf, 1.0)
+    with pytest.raises(ValueError, match=r"Invalid input: 10 is greater than -3\."):
+        bim.run_bisection_float_bits(fcn_3, 10, -3)
+    with pytest.raises(ValueError, match="a and b are not guaranteed to contain a root of the continous function provided"):
+        bim.run_bisection_float_bits(fcn_3, 5.0, 10.0)
+
+
+def test_iter_bisection():
+    known = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20)
+    steps = list(bim.iter_bisection(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20))
+    assert len(steps) == known["num_iter"] + 1
+    assert [step.a for step in steps] == known["all_a"]
+    assert [step.fcn_b for step in steps] == known["all_fcn_b"]
+    assert [step.iteration for step in steps] == list(range(0, known["num_iter"] + 1))
+    assert steps[-1].num_eval == known["num_eval"]
+    # stopping early on a custom criterion only evaluates what was needed
+    calls = []
+
+    def counted(x):
+        calls.append(x)
+        return fcn(x)
+
+    for step in bim.iter_bisection(counted, 0.0, 10.0, 10 ** -10, 10 ** -20):
+        if step.b - step.a < 0.1:
+            break
+    assert len(calls) == step.num_eval < known["num_eval"]
+    # errors are raised when the first step is requested
+    steps = bim.iter_bisection(fcn_3, 5.0, 10.0)
+    with pytest.raises(ValueError, match="a and b are not guaranteed to contain a root of the continous function provided"):
+        next(steps)
+    with pytest.raises(ValueError, match="Invalid method"):
+        next(bim.iter_bisection(fcn, 0.0, 10.0, method="newton"))
+
+
+def test_iter_bisection_resume():
+    known = list(bim.iter_bisection(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20))
+    steps = bim.iter_bisection(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20)
+    for step in steps:
+        if step.iteration == 10:
+            break
+    steps.close()
+    state = json.loads(json.dumps(step.state()))
+    calls = []
+
+    def counted(x):
+        calls.append(x)
+        return fcn(x)
+
+    resumed = list(bim.iter_bisection(counted, tol_input=10 ** -10, tol_output=10 ** -20, state=state))
+    assert resumed == known[11:]
+    assert len(calls) == len(resumed)
+    for method in ["brent", "multisection"]:
+        resumed = list(bim.iter_bisection(fcn, tol_input=10 ** -10, tol_output=10 ** -20, method=method, state=state))
+        assert resumed[-1].a <= np.sqrt(2) <= resumed[-1].b
+        assert resumed[0].iteration == 11
+
+
+def test_solver_instrument():
+    steps = []
+    instrument = bim.SolverInstrument(callback=steps.append, near_max_fraction=0.5)
+    known = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20)
+    result = bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20, instrument=instrument)
+    assert result["solution"] == known["solution"]
+    assert len(steps) == result["num_iter"] + 1
+    assert steps[-1].a == result["all_a"][-1]
+    bim.run_bisection_method(fcn, 0.0, 10.0, 10 ** -10, 10 ** -20, max_num_iter=60, method="brent", instrument=instrument)
+    with pytest.raises(ValueError):
+        bim.run_bisection_method(fcn_2, 0.0, 20.0, 10 ** -10, 10 ** -30, 10, instrument=instrument)
+    with pytest.raises(ValueError):
+        bim.run_bisection_method(fcn_3, 5.0, 10.0, instrument=instrument)
+    stats = instrument.stats()
+    assert stats["num_solve"] == 4
+    assert stats["num_failed"] == 2
+    # only the solve that failed after 11 iterations (max_num_iter=10) is near the maximum
+    assert stats["num_near_max_iter"] == 1
+    assert stats["num_eval"] == known["num_eval"] + 13 + 13 + 2
+    assert stats["num_iter"] == known["num_iter"] + 11 + 11
+    assert 0.0 < stats["eval_time"] < stats["total_time"]
+    assert np.isclose(stats["overhead_time"], stats["total_time"] - stats["eval_time"])
+    instrument.reset()
+    assert instrument.stats()["num_solve"] == 0
+    assert instrument.stats()["mean_iter"] == 0.0
+
+
+def test_timed_function():
+    instrument = bim.SolverInstrument()
+    timed = instrument.wrap(fcn)
+    assert timed(2.0) == 2.0
+    assert instrument.num_eval == 1
+    assert instrument.eval_time > 0.0
+
+
+def test_lazy_plotting_import():
+    script = "import sys; from bisectionmethod import bisection_method as bim; print('matplotlib' in sys.modules); bim.plot_bisection_results; print('matplotlib' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout.split()
+    assert output == ["False", "True"]
+    script = "import sys; from bisectionmethod import bisection_method; print([name for name in ('asyncio', 'multiprocessing', 'concurrent.futures.thread') if name in sys.modules])"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout.strip()
+    assert output == "[]"
+    from bisectionmethod import plotting
+    assert bim.plot_function_with_inset is plotting.plot_function_with_inset
+    with pytest.raises(AttributeError, match="has no attribute 'plot_everything'"):
+        bim.plot_everything
+
+
+def test_evaluate_curve():
+    from bisectionmethod import plotting
+    x = np.linspace(0.0, 2.0, 11)
+    assert np.array_equal(plotting.evaluate_curve(fcn, x), x ** 2 - 2)
+    # scalar-only functions fall back to one call per point
+    assert np.allclose(plotting.evaluate_curve(lambda x: float(x) - 1.0, x), x - 1.0)
+    assert np.array_equal(plotting.evaluate_curve(lambda x: 3.0, x), np.full(11, 3.0))
+    assert np.array_equal(plotting.evaluate_curve(lambda x: 2.0 if x > 1.0 else 0.0, x), np.where(x > 1.0, 2.0, 0.0))
+    cached = bim.EvaluationCache(fcn)
+    plotting.evaluate_curve(cached, x)
+    assert len(cached) == 0
+
+
+def test_downsample_indices():
+    from bisectionmethod import plotting
+    assert np.array_equal(plotting.downsample_indices(5), np.arange(0, 5))
+    assert np.array_equal(plotting.downsample_indices(5, 10), np.arange(0, 5))
+    indices = plotting.downsample_indices(1001, 11)
+    assert np.array_equal(indices, np.arange(0, 1001, 100))
+    assert np.array_equal(plotting.downsample_indices(10, 1), [0, 9])
+
+
+def test_plot_bisection_report(tmp_path):
+    import matplotlib.pyplot as plt
+    results = [bim.run_bisection_method(fcn, 0.0, b, 10 ** -10, 10 ** -20, history=history) for b in [2.0, 10.0] for history in ["list", "array"]]
+    results.append(bim.run_bisection_float_bits(fcn, 1.0, 2.0, 0.0, 0.0, history="last_k", history_size=20))
+    fig_names_with_path = [tmp_path.joinpath("report_%i.png" % (kk)) for kk in range(0, len(results))]
+    num_figures = len(plt.get_fignums())
+    bim.plot_bisection_report(results, fig_names_with_path, max_points=10)
+    assert all(fig_name_with_path.is_file() for fig_name_with_path in fig_names_with_path)
+    # the report does not open pyplot figures and the single plots close theirs
+    bim.plot_bisection_results(results[0], tmp_path.joinpath("single.png"), max_points=5)
+    bim.plot_function_with_inset(fcn, results[1], tmp_path.joinpath("inset.png"), max_points=5)
+    assert len(plt.get_fignums()) == num_figures
+    with pytest.raises(ValueError, match="Invalid input: 5 results and 1 file names."):
+        bim.plot_bisection_report(results, fig_names_with_path[:1])
@@ -0,0 +1,115 @@
+from bisectionmethod import bisection_method as bim
+from bisectionmethod import bulk
+import numpy as np
+import pytest
+
+
+def fcn_param(x, p):
+    return x ** 2 - p
+
+
+def fcn_shifted(x):
+    return x ** 2 - 2
+
+
+def write_brackets(path, num_rows):
+    rng = np.random.default_rng(0)
+    brackets = np.column_stack((np.zeros(num_rows), np.full(num_rows, 10.0), rng.uniform(1.0, 50.0, num_rows)))
+    # one bracket without a root and one invalid bracket
+    brackets[3] = [20.0, 30.0, 2.0]
+    brackets[5] = [10.0, 0.0, 2.0]
+    if path.suffix == ".npy":
+        np.save(path, brackets)
+    else:
+        np.savetxt(path, brackets, delimiter=",", header="a,b,p", comments="")
+    return brackets
+
+
+def test_load_function():
+    assert bulk.load_function("numpy:sin") is np.sin
+    with pytest.raises(ValueError, match="Invalid function: numpy. Must be of the form module:function."):
+        bulk.load_function("numpy")
+
+
+@pytest.mark.parametrize("suffix, skiprows", [(".npy", 0), (".csv", 1)])
+def test_iter_bracket_chunks(tmp_path, suffix, skiprows):
+    input_path = tmp_path.joinpath("brackets" + suffix)
+    brackets = write_brackets(input_path, 25)
+    assert bulk.count_rows(input_path, skiprows) == 25
+    chunks = list(bulk.iter_bracket_chunks(input_path, 10, 0, skiprows))
+    assert [offset for offset, _ in chunks] == [0, 10, 20]
+    assert np.allclose(np.vstack([chunk for _, chunk in chunks]), brackets)
+    chunks = list(bulk.iter_bracket_chunks(input_path, 10, 15, skiprows))
+    assert [offset for offset, _ in chunks] == [15]
+    assert np.allclose(chunks[0][1], brackets[15:])
+    with pytest.raises(ValueError, match="Invalid chunk size: 0. Must be at least 1."):
+        next(bulk.iter_bracket_chunks(input_path, 0))
+
+
+@pytest.mark.parametrize("suffix, skiprows", [(".npy", 0), (".csv", 1)])
+def test_solve_bulk(tmp_path, suffix, skiprows):
+    input_path = tmp_path.joinpath("brackets" + suffix)
+    output_path = tmp_path.joinpath("roots.npy")
+    brackets = write_brackets(input_path, 25)
+    summary = bulk.solve_bulk(fcn_param, input_path, output_path, chunk_size=7, skiprows=skiprows)
+    assert summary["num_rows"] == 25
+    assert summary["status_counts"] == {bim.STATUS_CONVERGED: 23, bim.STATUS_INVALID_INTERVAL: 1, bim.STATUS_SIGN_INCOMPATIBLE: 1}
+    output = np.load(output_path)
+    known = bim.run_bisection_batch(fcn_param, brackets[:, 0], brackets[:, 1], args=(brackets[:, 2],))
+    assert np.array_equal(output["solution"], known["solution"], equal_nan=True)
+    assert np.array_equal(output["num_iter"], known["num_iter"])
+    assert np.array_equal(output["status"], known["status"])
+
+
+def test_solve_bulk_resume(tmp_path):
+    input_path = tmp_path.joinpath("brackets.npy")
+    output_path = tmp_path.joinpath("roots.npy")
+    write_brackets(input_path, 25)
+    run_info = bulk.make_run_info(fcn_param, input_path, 0, 10 ** -9, 10 ** -30, 1000)
+    output = bulk.open_output(output_path, 25, run_info)
+    assert np.all(output["status"] == bulk.STATUS_NOT_RUN)
+    assert bulk.first_not_run(output, 10) == 0
+    del output
+    # solve only the last chunk, then resume from the first chunk that was not run
+    summary = bulk.solve_bulk(fcn_param, input_path, output_path, chunk_size=10, start=20)
+    assert summary["status_counts"][bulk.STATUS_NOT_RUN] == 20
+    assert bulk.first_not_run(np.load(output_path, mmap_mode="r"), 10) == 0
+    summary = bulk.solve_bulk(fcn_param, input_path, output_path, chunk_size=10)
+    assert summary["start"] == 0
+    assert bulk.STATUS_NOT_RUN not in summary["status_counts"]
+    summary = bulk.solve_bulk(fcn_param, input_path, output_path, chunk_size=10)
+    assert summary["start"] == 25
+    # an output of another input or function is not resumed
+    with pytest.raises(ValueError, match="roots.npy was not created by this run"):
+        bulk.solve_bulk(fcn_param, input_path, output_path, chunk_size=10, tol_input=10 ** -6)
+    write_brackets(input_path, 25)
+    with pytest.raises(ValueError, match=r"Pass overwrite=True \(--overwrite\) to replace it."):
+        bulk.solve_bulk(fcn_param, input_path, output_path, chunk_size=10)
+    summary = bulk.solve_bulk(fcn_param, input_path, output_path, chunk_size=10, overwrite=True)
+    assert summary["start"] == 0
+    assert bulk.STATUS_NOT_RUN not in summary["status_counts"]
+    output_path.with_name("roots.npy.json").unlink()
+    with pytest.raises(ValueError, match="roots.npy was not created by this run"):
+        bulk.solve_bulk(fcn_param, input_path, output_path, chunk_size=10)
+
+
+def test_main(tmp_path, capsys):
+    input_path = tmp_path.joinpath("brackets.npy")
+    output_path = tmp_path.joinpath("roots.npy")
+    np.save(input_path, np.array([[0.5, 2.0], [0.25, 10.0]]))
+    assert bulk.main(["numpy:log", str(input_path), str(output_path), "--chunk-size", "1"]) == 0
+    assert "2 rows" in capsys.readouterr().out
+    assert np.allclose(np.load(output_path)["solution"], 1.0)
+    # a leftover output of another input is replaced only with --overwrite
+    other_path = tmp_path.joinpath("other.csv")
+    other_path.write_text("0,2\n0,2\n")
+    capsys.readouterr()
+    assert bulk.main(["numpy:log", str(other_path), str(output_path)]) == 1
+    captured = capsys.readouterr()
+    assert "was not created by this run" in captured.err
+    assert captured.out == ""
+    assert bulk.main(["test_bulk:fcn_shifted", str(other_path), str(output_path), "--overwrite"]) == 0
+    assert np.allclose(np.load(output_path)["solution"], np.sqrt(2))
+    np.save(input_path, np.array([0.0, 2.0]))
+    with pytest.raises(ValueError, match="Invalid input: brackets must be rows with at least 2 columns"):
+        bulk.solve_bulk(np.log, input_path, tmp_path.joinpath("other.npy"))
@@ -0,0 +1,61 @@
+from bisectionmethod import bisection_method as bim
+from bisectionmethod import parallel
+import numpy as np
+import pytest
+
+
+def fcn(x):
+    return x ** 2 - 2
+
+
+def fcn_shifted(x):
+    return x ** 3 - 5
+
+
+def fcn_raises(x):
+    raise ZeroDivisionError("division by zero")
+
+
+def test_status_from_error():
+    assert parallel.status_from_error(ValueError("Invalid input: a must be less than b")) == bim.STATUS_INVALID_INTERVAL
+    assert parallel.status_from_error(ValueError("a and b are not guaranteed to contain a root of the continous function provided")) == bim.STATUS_SIGN_INCOMPATIBLE
+    assert parallel.status_from_error(ValueError("Maximum number of iterations (3) reached without convergence")) == bim.STATUS_MAX_ITER
+    assert parallel.status_from_error(ZeroDivisionError()) == parallel.STATUS_ERROR
+
+
+@pytest.mark.parametrize("method", ["bisection", "brent"])
+@pytest.mark.parametrize("num_workers, chunk_size", [(1, None), (2, 1), (3, 2)])
+def test_run_bisection_processes(method, num_workers, chunk_size):
+    problems = [(fcn, 0, 2), (fcn_shifted, 0, 3), (fcn, 2, 0), (fcn, 3, 4), (fcn_raises, 0, 1), (fcn, -2, 0)]
+    result = parallel.run_bisection_processes(problems, method=method, num_workers=num_workers, chunk_size=chunk_size)
+    expected = [bim.STATUS_CONVERGED, bim.STATUS_CONVERGED, bim.STATUS_INVALID_INTERVAL, bim.STATUS_SIGN_INCOMPATIBLE, parallel.STATUS_ERROR, bim.STATUS_CONVERGED]
+    assert result["status"].tolist() == expected
+    for index in (0, 1, 5):
+        single = bim.run_bisection_method(*problems[index], method=method, history="none")
+        assert result["solution"][index] == single["solution"]
+        assert result["num_iter"][index] == single["num_iter"]
+        assert result["num_eval"][index] == single["num_eval"]
+    assert np.isnan(result["solution"][[2, 3, 4]]).all()
+    assert sorted(result["errors"]) == [2, 3, 4]
+    assert result["errors"][4] == "ZeroDivisionError: division by zero"
+    assert result["errors"][2].startswith("ValueError: Invalid input")
+
+
+def test_run_bisection_processes_max_iter():
+    result = parallel.run_bisection_processes([(fcn, 0, 2)], max_num_iter=3, num_workers=1)
+    assert result["status"].tolist() == [bim.STATUS_MAX_ITER]
+
+
+def test_run_bisection_processes_empty():
+    result = parallel.run_bisection_processes([], num_workers=1)
+    assert result["solution"].shape == (0,)
+    assert result["errors"] == {}
+
+
+def test_run_bisection_processes_invalid():
+    with pytest.raises(ValueError, match="Invalid number of workers: 0. Must be at least 1."):
+        parallel.run_bisection_processes([(fcn, 0, 2)], num_workers=0)
+    with pytest.raises(ValueError, match="Invalid chunk size: 0. Must be at least 1."):
+        parallel.run_bisection_processes([(fcn, 0, 2)], num_workers=1, chunk_size=0)
+    with pytest.raises(ValueError, match="Invalid method"):
+        parallel.run_bisection_processes([(fcn, 0, 2)], method="newton")
@@ -0,0 +1,125 @@
+from bisectionmethod import polynomial
+import numpy as np
+import pytest
+
+
+def test_horner():
+    coefficients = np.array([[1, 0, -2], [2, -3, 1], [0, 1, 4]])
+    x = np.array([1.5, -2.0, 3.0])
+    assert np.allclose(polynomial.horner(coefficients, x), [np.polyval(row, value) for row, value in zip(coefficients, x)])
+    grid = np.linspace(-3, 3, 7)
+    assert np.allclose(polynomial.horner(coefficients[:, None, :], grid), [np.polyval(row, grid) for row in coefficients])
+    assert polynomial.horner([1, 0, -2], 2.0) == 2.0
+
+
+def test_poly_divide():
+    rng = np.random.default_rng(0)
+    dividend = polynomial.normalize(rng.normal(size=(20, 6)))
+    divisor = polynomial.normalize(np.column_stack((np.zeros((20, 3)), rng.normal(size=(20, 3)))))
+    quotient, remainder = polynomial.poly_divide(dividend, divisor)
+    for row, (a, b) in enumerate(zip(dividend, divisor)):
+        expected_quotient, expected = np.polydiv(a, np.trim_zeros(b, "f"))
+        assert np.allclose(quotient[row, -len(expected_quotient):], expected_quotient)
+        assert np.all(quotient[row, :-len(expected_quotient)] == 0)
+        assert np.allclose(remainder[row, -len(expected):], expected)
+        assert np.all(remainder[row, :-len(expected)] == 0)
+
+
+def test_sturm_table():
+    # x^3 - x: p, p' and -rem(p, p') = (2/3) x, then a constant
+    table = polynomial.sturm_table(np.array([[1.0, 0, -1, 0]]))
+    assert np.allclose(table[0, 0], [1, 0, -1, 0])
+    assert np.allclose(table[0, 1], [0, 1, 0, -1 / 3])
+    assert np.allclose(table[0, 2], [0, 0, 1, 0])
+    assert np.allclose(table[0, 3], [0, 0, 0, 1])
+    changes = polynomial.sign_changes(polynomial.horner(table, np.array([[-2.0], [2.0]])))
+    assert changes[0] - changes[1] == 3
+
+
+def test_isolate_real_roots():
+    isolated = polynomial.isolate_real_roots(np.poly([-1, 0.5, 0.50001, 3]))
+    assert isolated["poly_index"].tolist() == [0, 0, 0, 0]
+    assert np.all(isolated["num_roots"] == 1)
+    for lo, hi, root in zip(isolated["lo"], isolated["hi"], [-1, 0.5, 0.50001, 3]):
+        assert lo < root <= hi
+
+
+def test_find_polynomial_roots():
+    result = polynomial.find_polynomial_roots([1, 0, -2])
+    assert np.allclose(result["roots"], [-np.sqrt(2), np.sqrt(2)])
+    assert result["brackets"].shape == (2, 2)
+    # a double root has no sign change
+    assert np.allclose(polynomial.find_polynomial_roots(np.poly([1, 1, -2, 0.5]))["roots"], [-2, 0.5, 1], atol=10 ** -7)
+    assert np.allclose(polynomial.find_polynomial_roots([1, 0, 0])["roots"], [0])
+    assert len(polynomial.find_polynomial_roots([5])["roots"]) == 0
+
+
+@pytest.mark.parametrize("roots", [[0, 0, 5], [0, 0, -2, 4], [0, 0, 0, 1], [0, 0], [2, 2], [0.5, 0.5, 3, 3, 3, -1],
+                                   [0.25, 0.25, -0.75, -0.75, 2], [0.75, 0.75, 0.75, -1.5, -1.5], [1, 1, 1, 1, -8, 3]])
+def test_find_polynomial_roots_multiple(roots):
+    # multiple roots at 0 and other dyadic points, where the brackets are split
+    distinct, multiplicity = np.unique(roots, return_counts=True)
+    result = polynomial.find_polynomial_roots(np.poly(roots))
+    assert np.allclose(result["roots"], distinct, atol=10 ** -7)
+    assert result["num_roots"].tolist() == multiplicity.tolist()
+    isolated = polynomial.isolate_real_roots(np.poly(roots))
+    assert isolated["num_roots"].tolist() == multiplicity.tolist()
+
+
+def test_find_polynomial_roots_cluster():
+    # roots closer than the resolution of rtol are merged, and reported with their number
+    result = polynomial.find_polynomial_roots(np.poly([1, 1.0000001, 3]))
+    assert np.allclose(result["roots"], [1, 3], atol=10 ** -6)
+    assert result["num_roots"].tolist() == [2, 1]
+    result = polynomial.find_polynomial_roots(np.poly([1, 1.0000001, 3]), rtol=10 ** -30)
+    assert np.allclose(result["roots"], [1, 1.0000001, 3], atol=10 ** -9)
+    assert result["num_roots"].tolist() == [1, 1, 1]
+    assert np.allclose(polynomial.find_polynomial_roots(np.poly([1, 1.00001, 3]))["roots"], [1, 1.00001, 3])
+
+
+def test_find_polynomial_roots_many():
+    coefficients = np.array([[0, 1, 0, -2], [0, 0, 1, -3], [0, 1, 0, 1], [1, -6, 11, -6]])
+    roots = polynomial.find_polynomial_roots(coefficients)["roots"]
+    assert len(roots) == 4
+    assert np.allclose(roots[0], [-np.sqrt(2), np.sqrt(2)])
+    assert np.allclose(roots[1], [3])
+    assert len(roots[2]) == 0
+    assert np.allclose(roots[3], [1, 2, 3])
+    coefficients = np.random.default_rng(1).normal(size=(500, 8))
+    roots = polynomial.find_polynomial_roots(coefficients)["roots"]
+    for row, found in zip(coefficients, roots):
+        expected = np.roots(row)
+        expected = np.sort(expected[np.abs(expected.imag) < 10 ** -7].real)
+        assert np.allclose(found, expected, atol=10 ** -6)
+
+
+@pytest.mark.parametrize("degree", [15, 18])
+def test_find_polynomial_roots_high_degree(degree):
+    # small but nonzero remainder coefficients must be kept
+    expected = np.arange(1, degree + 1.0)
+    result = polynomial.find_polynomial_roots(np.poly(expected))
+    assert np.allclose(result["roots"], expected, atol=10 ** -3)
+    assert np.all(result["num_roots"] == 1)
+
+
+def test_find_polynomial_roots_large():
+    # the float spacing near 1e7 is wider than tol_input
+    result = polynomial.find_polynomial_roots(np.poly([10 ** -7, 10 ** 7]))
+    assert np.allclose(result["roots"], [10 ** -7, 10 ** 7], rtol=10 ** -12, atol=10 ** -9)
+    with pytest.raises(ValueError, match="Maximum number of iterations"):
+        polynomial.find_polynomial_roots(np.poly([10 ** -7, 10 ** 7]), max_num_iter=10)
+
+
+def test_check_root_counts():
+    assert polynomial.check_root_counts(np.array([[1.0, 0, -1, 0]]), np.array([0, 0, 0]), np.array([1, 1, 1]))
+    with pytest.raises(ValueError, match="Invalid root count: 2 real roots for polynomial 0 of degree 3"):
+        polynomial.check_root_counts(np.array([[1.0, 0, -1, 0]]), np.array([0, 0]), np.array([1, 1]))
+
+
+def test_check_coefficients():
+    with pytest.raises(ValueError, match="Invalid polynomial: the zero polynomial has no isolated roots."):
+        polynomial.find_polynomial_roots([[1, 0, -2], [0, 0, 0]])
+    with pytest.raises(ValueError, match="Invalid polynomial: coefficients must be finite."):
+        polynomial.find_polynomial_roots([1, np.nan])
+    with pytest.raises(ValueError, match="Invalid polynomial: coefficients must be a 1-D or 2-D array"):
+        polynomial.find_polynomial_roots(np.ones((2, 2, 2)))
@@ -0,0 +1,82 @@
+from bisectionmethod import bisection_method as bim
+from bisectionmethod import sweep
+import numpy as np
+import pytest
+
+
+def fcn_param(x, p):
+    return x ** 2 - p
+
+
+def test_warm_bracket():
+    fcn = lambda x: fcn_param(x, 2)
+    lower, upper, fcn_lower, fcn_upper, num_eval, num_expand, fallback = sweep.warm_bracket(fcn, 1.0, 0.1, 0, 10)
+    assert lower < np.sqrt(2) < upper
+    assert (fcn_lower, fcn_upper) == (fcn(lower), fcn(upper))
+    assert num_expand == 3
+    assert num_eval == 2 * (num_expand + 1)
+    assert not fallback
+    # the bracket never leaves [a, b], and an endpoint clipped to b is evaluated once
+    lower, upper, fcn_lower, fcn_upper, num_eval, num_expand, fallback = sweep.warm_bracket(fcn, 9.9, 1, 0, 10)
+    assert 0 <= lower and upper == 10
+    assert num_eval == num_expand + 2
+    # the expansion stops at [a, b] once it could no longer beat a cold solve
+    lower, upper, fcn_lower, fcn_upper, num_eval, num_expand, fallback = sweep.warm_bracket(lambda x: x - 9.0, 1.0, 10 ** -9, 0, 10, 2.0, 10 ** -9)
+    assert (lower, upper) == (0, 10)
+    assert fallback
+    assert num_eval + bim.bisection_iter_bound(0, 10, 10 ** -9) < 2 * (bim.bisection_iter_bound(0, 10, 10 ** -9) + 2)
+    with pytest.raises(ValueError, match="a and b are not guaranteed to contain a root"):
+        sweep.warm_bracket(fcn, 5, 1, 3, 10)
+
+
+@pytest.mark.parametrize("method", ["bisection", "brent"])
+def test_run_bisection_sweep(method):
+    params = np.linspace(1, 4, 200)
+    result = sweep.run_bisection_sweep(fcn_param, params, 0, 10, method=method, compare_cold=True)
+    assert np.allclose(result["solution"], np.sqrt(params), atol=1e-8)
+    for index in (0, 57, 199):
+        cold = bim.run_bisection_method(lambda x: fcn_param(x, params[index]), 0, 10, method=method, history="none")
+        assert result["num_iter_cold"][index] == cold["num_iter"]
+    assert result["num_iter"][0] == result["num_iter_cold"][0]
+    assert result["iterations_saved"] == np.sum(result["num_iter_cold"]) - np.sum(result["num_iter"])
+    assert result["iterations_saved"] > 0
+    assert np.all(result["num_eval"][1:] >= result["num_iter"][1:] + 2)
+
+
+def test_run_bisection_sweep_estimate():
+    params = np.linspace(1, 4, 100)
+    result = sweep.run_bisection_sweep(fcn_param, params, 0, 10)
+    assert np.all(result["num_iter_cold"] == bim.bisection_iter_bound(0, 10, 10 ** -9))
+    # after the first solve, the warm bracket follows the root and rarely needs to expand
+    assert np.sum(result["num_expand"][2:]) < 5
+    assert np.sum(result["num_iter"]) < 0.8 * np.sum(result["num_iter_cold"])
+    # a jump of the root is recovered by expanding the warm bracket
+    result = sweep.run_bisection_sweep(fcn_param, [1, 1.01, 81], 0, 10)
+    assert np.allclose(result["solution"], [1, np.sqrt(1.01), 9])
+    assert result["num_expand"][2] > 0
+    # a jump far beyond the warm bracket falls back to the cold bracket
+    result = sweep.run_bisection_sweep(lambda x, p: x - (1.0 if p < 0.5 else 9.0), [0.1, 0.2, 0.7], 0, 10)
+    assert np.allclose(result["solution"], [1, 1, 9])
+    assert result["cold_fallback"].tolist() == [False, False, True]
+    assert result["num_eval"][2] < 2 * bim.run_bisection_method(lambda x: x - 9.0, 0, 10, history="none")["num_eval"]
+
+
+@pytest.mark.parametrize("method", ["illinois", "brent", "itp", "multisection"])
+def test_run_bisection_sweep_cold_unknown(method):
+    # the bisection bound is not the cost of a cold solve with other methods
+    params = np.linspace(1, 4, 20)
+    result = sweep.run_bisection_sweep(fcn_param, params, 0, 10, method=method)
+    assert result["num_iter_cold"] is None
+    assert result["iterations_saved"] is None
+    assert np.allclose(result["solution"], np.sqrt(params))
+    result = sweep.run_bisection_sweep(fcn_param, params, 0, 10, 0.0, 10 ** -12)
+    assert result["iterations_saved"] is None
+
+
+def test_run_bisection_sweep_invalid():
+    with pytest.raises(ValueError, match="Invalid growth: 1. Must be greater than 1."):
+        sweep.run_bisection_sweep(fcn_param, [1, 2], 0, 10, growth=1)
+    with pytest.raises(ValueError, match="Invalid initial width: 0. Must be positive."):
+        sweep.run_bisection_sweep(fcn_param, [1, 2], 0, 10, initial_width=0)
+    with pytest.raises(ValueError, match="a and b are not guaranteed to contain a root"):
+        sweep.run_bisection_sweep(fcn_param, [1, 200], 0, 10)
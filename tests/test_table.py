@@ -0,0 +1,66 @@
+from bisectionmethod import bisection_method as bim
+from bisectionmethod import table
+import numpy as np
+import pytest
+
+
+def fcn_param(x, p):
+    return x ** 2 - p
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_build_root_table(vectorized):
+    root_table = table.build_root_table(fcn_param, 0.01, 4, 0, 10, num_grid=8, tol_table=10 ** -5, vectorized=vectorized)
+    assert np.all(np.diff(root_table.params) > 0)
+    assert np.allclose(root_table.roots, np.sqrt(root_table.params))
+    # the grid is refined where the root changes quickly, near p = 0
+    widths = np.diff(root_table.params)
+    assert widths[0] < widths[-1] / 8
+    p = np.random.default_rng(0).uniform(0.01, 4, 10000)
+    assert np.max(np.abs(root_table.lookup(p) - np.sqrt(p))) < 10 ** -5
+    assert root_table.lookup(0.01) == pytest.approx(0.1)
+    assert root_table.lookup(4) == pytest.approx(2)
+    assert isinstance(root_table.lookup(2.0), float)
+
+
+def test_root_table_cell():
+    root_table = table.RootTable([0, 0.1, 0.15, 1, 3], [0, 1, 2, 3, 4], [0, 0, 0, 0], 0, 10)
+    p = np.array([0, 0.05, 0.1, 0.12, 0.15, 0.2, 0.99, 1, 2.5, 3])
+    assert root_table.cell(p).tolist() == [0, 0, 0, 1, 1, 2, 2, 2, 3, 3]
+    assert root_table.cell(p).tolist() == (np.clip(np.searchsorted(root_table.params, p) - 1, 0, 3)).tolist()
+    assert root_table.lookup(0.125) == pytest.approx(1.5)
+    with pytest.raises(ValueError, match="Invalid input: p must be within the table"):
+        root_table.lookup(3.5)
+    with pytest.raises(ValueError, match="Invalid input: params must be at least 2 increasing values."):
+        table.RootTable([0, 1, 1], [0, 1, 2], [0, 0], 0, 10)
+
+
+def test_lookup_polished():
+    root_table = table.build_root_table(fcn_param, 1, 4, 0, 10, num_grid=4, tol_table=10 ** -4)
+    cold = bim.run_bisection_method(lambda x: fcn_param(x, 2), 0, 10, history="none")
+    result = root_table.lookup_polished(fcn_param, 2)
+    assert abs(result["solution"] - np.sqrt(2)) < 10 ** -9
+    assert result["num_iter"] < cold["num_iter"] - 10
+    # a wrong table is corrected by expanding the bracket
+    wrong_table = table.RootTable([1, 4], [1.5, 1.5], [0], 0, 10)
+    result = wrong_table.lookup_polished(fcn_param, 2)
+    assert abs(result["solution"] - np.sqrt(2)) < 10 ** -9
+    assert result["num_expand"] > 0
+
+
+def test_save_and_load_root_table(tmp_path):
+    root_table = table.build_root_table(fcn_param, 1, 4, 0, 10, num_grid=4)
+    root_table.save(tmp_path / "table.npz")
+    loaded = table.load_root_table(tmp_path / "table.npz")
+    assert np.array_equal(loaded.params, root_table.params)
+    assert np.array_equal(loaded.roots, root_table.roots)
+    assert np.array_equal(loaded.errors, root_table.errors)
+    assert (loaded.a, loaded.b) == (0, 10)
+    assert loaded.lookup(2.5) == root_table.lookup(2.5)
+
+
+def test_build_root_table_invalid():
+    with pytest.raises(ValueError, match="Invalid number of grid cells: 0. Must be at least 1."):
+        table.build_root_table(fcn_param, 1, 4, 0, 10, num_grid=0)
+    with pytest.raises(ValueError, match=r"Invalid input: no root found in \[0, 1\]"):
+        table.build_root_table(fcn_param, 1, 4, 0, 1)